@@ -42,7 +42,6 @@ class CategoryFactory(factory.django.DjangoModelFactory):
 
     class Meta:
         model = Category
-        django_get_or_create = ("slug",)
 
     name = factory.Sequence(lambda n: f"Category {n}")
     slug = factory.LazyAttribute(lambda obj: slugify(obj.name) if obj.name else "")
@@ -54,7 +53,6 @@ class TagFactory(factory.django.DjangoModelFactory):
 
     class Meta:
         model = Tag
-        django_get_or_create = ("slug",)
 
     name = factory.Sequence(lambda n: f"tag{n}")
     slug = factory.LazyAttribute(lambda obj: slugify(obj.name) if obj.name else "")
@@ -84,8 +82,22 @@ class PollFactory(factory.django.DjangoModelFactory):
         if not create:
             return
         if extracted:
-            for tag in extracted:
-                self.tags.add(tag)
+            # Insert the through rows directly: one query, no m2m_changed signals
+            through = Poll.tags.through
+            through.objects.bulk_create(
+                [through(poll_id=self.pk, tag_id=tag.pk) for tag in extracted],
+                ignore_conflicts=True,
+            )
+
+
+def bulk_create_polls(size, created_by, **kwargs):
+    """Create ``size`` polls owned by ``created_by`` with a single bulk INSERT.
+
+    Polls are built with ``PollFactory.build_batch`` and saved through
+    ``bulk_create``, so ``post_generation`` hooks such as ``tags`` do not run.
+    """
+    polls = PollFactory.build_batch(size, created_by=created_by, **kwargs)
+    return Poll.objects.bulk_create(polls)
 
 
 class PollOptionFactory(factory.django.DjangoModelFactory):
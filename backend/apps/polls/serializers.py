@@ -26,6 +26,9 @@ class CategorySerializer(serializers.ModelSerializer):
 
     def get_poll_count(self, obj):
         """Get count of polls in this category."""
+        # Querysets annotated with poll_count avoid a COUNT query per row
+        if hasattr(obj, "poll_count"):
+            return obj.poll_count
         return obj.polls.count()
 
 
@@ -41,13 +44,16 @@ class TagSerializer(serializers.ModelSerializer):
 
     def get_poll_count(self, obj):
         """Get count of polls with this tag."""
+        # Querysets annotated with poll_count avoid a COUNT query per row
+        if hasattr(obj, "poll_count"):
+            return obj.poll_count
         return obj.polls.count()
 
 
 class PollOptionSerializer(serializers.ModelSerializer):
     """Serializer for PollOption model with language support."""
 
-    vote_count = serializers.ReadOnlyField()
+    vote_count = serializers.SerializerMethodField()
     cached_vote_count = serializers.ReadOnlyField()
 
     class Meta:
@@ -62,6 +68,13 @@ class PollOptionSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "vote_count", "cached_vote_count", "created_at"]
 
+    def get_vote_count(self, obj):
+        """Get the number of votes for this option."""
+        # Querysets annotated with num_votes avoid a COUNT query per option
+        if hasattr(obj, "num_votes"):
+            return obj.num_votes
+        return obj.vote_count
+
     def to_representation(self, instance):
         """Override to return translated text based on request language."""
         data = super().to_representation(instance)
@@ -139,7 +152,8 @@ class PollSerializer(serializers.ModelSerializer):
 
     def get_tag_ids(self, obj):
         """Get list of tag IDs."""
-        return list(obj.tags.values_list("id", flat=True))
+        # Iterate tags.all() so a prefetch_related("tags") cache is reused
+        return [tag.id for tag in obj.tags.all()]
 
     def to_representation(self, instance):
         """Override to return translated fields based on request language."""
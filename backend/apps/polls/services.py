@@ -7,6 +7,7 @@ import logging
 from typing import Dict, List, Optional, Tuple
 
 from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
 
 from .models import Poll, PollOption
@@ -60,6 +61,7 @@ def get_results_cache_key(poll_id: int) -> str:
     return f"poll_results:{poll_id}"
 
 
+@transaction.atomic
 def clone_poll(
     poll: Poll,
     user,
@@ -71,6 +73,8 @@ def clone_poll(
     """
     Clone an existing poll with all options.
 
+    The cloned poll and its options are written in a single transaction.
+
     Args:
         poll: Poll instance to clone
         user: User who will own the cloned poll
@@ -85,8 +89,11 @@ def clone_poll(
     Raises:
         ValueError: If poll has no options
     """
+    # Fetch the options once; the same rows are checked and copied below
+    original_options = list(poll.options.order_by("order"))
+
     # Validate poll has options
-    if poll.options.count() == 0:
+    if not original_options:
         raise ValueError("Cannot clone poll: poll has no options")
 
     # Generate new title
@@ -126,14 +133,19 @@ def clone_poll(
     # Create the cloned poll
     cloned_poll = Poll.objects.create(**poll_data)
 
-    # Clone all options
-    for original_option in poll.options.all().order_by("order"):
-        PollOption.objects.create(
-            poll=cloned_poll,
-            text=original_option.text,
-            order=original_option.order,
-            cached_vote_count=0,  # Reset vote count
-        )
+    # Clone all options in a single INSERT
+    PollOption.objects.bulk_create(
+        [
+            PollOption(
+                poll=cloned_poll,
+                text=original_option.text,
+                order=original_option.order,
+                cached_vote_count=0,  # Reset vote count
+            )
+            for original_option in original_options
+        ],
+        batch_size=500,
+    )
 
     logger.info(f"Poll {poll.id} cloned to poll {cloned_poll.id} by user {user.id}")
 
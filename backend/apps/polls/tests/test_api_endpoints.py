@@ -3,6 +3,7 @@ Comprehensive tests for poll CRUD API endpoints.
 """
 
 import pytest
+from apps.polls.factories import bulk_create_polls
 from apps.polls.models import Poll, PollOption
 from django.contrib.auth.models import User
 from django.urls import reverse
@@ -60,6 +61,15 @@ class TestPollCreation:
         assert len(response.data.get("options", [])) == 0
         assert response.data["is_draft"] is True
 
+
+@pytest.mark.django_db
+class TestPollCreationAuthentication:
+    """Test POST /api/v1/polls/ authentication.
+
+    Anonymous requests are rejected by the view, but AuditLogMiddleware still
+    records every request, so the class needs database access for that insert.
+    """
+
     def test_poll_creation_requires_authentication(self):
         """Test that poll creation requires authentication."""
         client = APIClient()
@@ -82,12 +92,7 @@ class TestPollListing:
     def test_poll_listing_with_pagination(self, user):
         """Test poll listing with pagination."""
         # Create multiple polls
-        for i in range(25):
-            Poll.objects.create(
-                title=f"Poll {i}",
-                description=f"Description {i}",
-                created_by=user,
-            )
+        bulk_create_polls(25, created_by=user)
 
         client = APIClient()
         client.force_authenticate(user=user)
@@ -103,9 +108,8 @@ class TestPollListing:
         user2 = User.objects.create_user(username="user2", password="pass")
 
         # Create polls by different users
-        Poll.objects.create(title="Poll 1", created_by=user)
-        Poll.objects.create(title="Poll 2", created_by=user)
-        Poll.objects.create(title="Poll 3", created_by=user2)
+        bulk_create_polls(2, created_by=user)
+        bulk_create_polls(1, created_by=user2)
 
         client = APIClient()
         client.force_authenticate(user=user)
@@ -453,10 +457,8 @@ class TestOptionManagement:
         assert response.status_code == status.HTTP_201_CREATED
 
         # Verify order
-        poll.refresh_from_db()
-        options = poll.options.all()
-        for i, option in enumerate(options):
-            assert option.order == i
+        orders = list(poll.options.order_by("order").values_list("order", flat=True))
+        assert orders == [0, 1, 2]
 
 
 @pytest.mark.django_db
@@ -2,290 +2,354 @@
 Tests for poll categories and tags functionality.
 """
 
+import json
+from functools import lru_cache
+
 import pytest
+from apps.polls.factories import bulk_create_polls
 from apps.polls.models import Category, Poll, Tag
-from django.contrib.auth.models import User
+from apps.polls.views import CategoryViewSet, PollViewSet, TagViewSet
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from rest_framework import status
+from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_400_BAD_REQUEST
 from rest_framework.test import APIClient
 
-
-@pytest.fixture
-def user():
-    """Create a test user."""
-    return User.objects.create_user(username="testuser", password="testpass123")
-
-
-@pytest.fixture
+# Every test runs in a rolled-back transaction; none rely on reset sequences
+pytestmark = pytest.mark.django_db
+
+# URLs resolved once at import; detail URLs are templates filled with str.format
+POLL_LIST_URL = reverse("poll-list")
+CATEGORY_LIST_URL = reverse("category-list")
+TAG_LIST_URL = reverse("tag-list")
+CATEGORY_DETAIL_URL = reverse("category-detail", kwargs={"pk": 0}).replace(
+    "/0/", "/{}/"
+)
+CATEGORY_POLLS_URL = reverse("category-polls", kwargs={"pk": 0}).replace("/0/", "/{}/")
+TAG_DETAIL_URL = reverse("tag-detail", kwargs={"pk": 0}).replace("/0/", "/{}/")
+TAG_POLLS_URL = reverse("tag-polls", kwargs={"pk": 0}).replace("/0/", "/{}/")
+
+# Request bodies encoded once instead of by APIClient(format="json") per request
+JSON = "application/json"
+
+
+@lru_cache(maxsize=None)
+def _name_body(name):
+    """Return the encoded body for creating a category or tag."""
+    return json.dumps({"name": name}).encode()
+
+
+@lru_cache(maxsize=None)
+def _poll_body(category_id=None, tag_ids=()):
+    """Return the encoded body for creating a two-option poll."""
+    data = {
+        "title": "Test Poll",
+        "description": "Test description",
+        "options": [
+            {"text": "Option 1"},
+            {"text": "Option 2"},
+        ],
+    }
+    if category_id is not None:
+        data["category"] = category_id
+    if tag_ids:
+        data["tags"] = list(tag_ids)
+    return json.dumps(data).encode()
+
+
+# Query ceilings for unpaginated list endpoints: SELECT + audit log INSERT,
+# plus the tags and options prefetches for poll lists
+LIST_QUERY_BUDGET = 2
+POLL_LIST_QUERY_BUDGET = 4
+# Lists with categorized polls add the category prefetch, and the category
+# polls endpoint also looks up the category itself
+CATEGORIZED_POLL_LIST_QUERY_BUDGET = POLL_LIST_QUERY_BUDGET + 1
+CATEGORY_POLLS_QUERY_BUDGET = CATEGORIZED_POLL_LIST_QUERY_BUDGET + 1
+
+
+@pytest.fixture(scope="module", autouse=True)
+def disable_pagination():
+    """Serve unpaginated lists so each list request skips its COUNT(*) query.
+
+    Tests here create a handful of rows, so pagination adds a query without
+    changing what they check. Other modules keep pagination to cover it.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for viewset in (PollViewSet, CategoryViewSet, TagViewSet):
+            mp.setattr(viewset, "pagination_class", None)
+        yield
+
+
+def _results(response):
+    """Return the result list of a paginated or unpaginated list response."""
+    data = response.data
+    return data["results"] if isinstance(data, dict) and "results" in data else data
+
+
+# ``user``, ``category`` and ``tag`` are shared by every test in the module;
+# they are the only rows that persist between tests
+@pytest.fixture(scope="module")
+def user(module_user):
+    """Return the poll owner, shared by the module."""
+    return module_user
+
+
+@pytest.fixture(scope="module")
 def api_client():
     """Create an API client."""
     return APIClient()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def authenticated_client(api_client, user):
-    """Create an authenticated API client."""
+    """Create an authenticated API client, shared by every test in this module."""
     api_client.force_authenticate(user=user)
     return api_client
 
 
-@pytest.fixture
-def category():
+@pytest.fixture(scope="module")
+def category(django_db_setup, django_db_blocker):
     """Create a test category."""
-    return Category.objects.create(
-        name="Politics", slug="politics", description="Political polls"
-    )
+    with django_db_blocker.unblock():
+        category = Category.objects.create(
+            name="Politics", slug="politics", description="Political polls"
+        )
+    yield category
+    with django_db_blocker.unblock():
+        category.delete()
 
 
-@pytest.fixture
-def tag():
+@pytest.fixture(scope="module")
+def tag(django_db_setup, django_db_blocker):
     """Create a test tag."""
-    return Tag.objects.create(name="election", slug="election")
-
-
-@pytest.mark.django_db
-class TestCategoryCreation:
-    """Test category creation."""
-
-    def test_create_category(self, authenticated_client):
-        """Test creating a category."""
-        url = reverse("category-list")
-        data = {"name": "Sports", "description": "Sports related polls"}
-        response = authenticated_client.post(url, data, format="json")
-        assert response.status_code == status.HTTP_201_CREATED
-        assert response.data["name"] == "Sports"
-        assert response.data["slug"] == "sports"
-        assert Category.objects.filter(name="Sports").exists()
-
-    def test_create_category_auto_slug(self, authenticated_client):
-        """Test that slug is auto-generated from name."""
-        url = reverse("category-list")
-        data = {"name": "Entertainment & Media"}
-        response = authenticated_client.post(url, data, format="json")
-        assert response.status_code == status.HTTP_201_CREATED
-        assert response.data["slug"] == "entertainment-media"
+    with django_db_blocker.unblock():
+        tag = Tag.objects.create(name="election", slug="election")
+    yield tag
+    with django_db_blocker.unblock():
+        tag.delete()
+
+
+class TestCategoryAndTagCreation:
+    """Test category and tag creation."""
+
+    @pytest.mark.parametrize(
+        "url,model,name,expected_slug",
+        [
+            (CATEGORY_LIST_URL, Category, "Sports", "sports"),
+            (
+                CATEGORY_LIST_URL,
+                Category,
+                "Entertainment & Media",
+                "entertainment-media",
+            ),
+            (TAG_LIST_URL, Tag, "football", "football"),
+            (TAG_LIST_URL, Tag, "World Cup 2024", "world-cup-2024"),
+        ],
+    )
+    def test_create_auto_slug(
+        self, authenticated_client, url, model, name, expected_slug
+    ):
+        """Test creating a category or tag auto-generates its slug from the name."""
+        body = _name_body(name)
+        response = authenticated_client.post(url, body, content_type=JSON)
+        assert response.status_code == HTTP_201_CREATED
+        assert response.data["name"] == name
+        assert response.data["slug"] == expected_slug
+        assert model.objects.filter(name=name).exists()
 
     def test_create_category_duplicate_name_fails(self, authenticated_client, category):
         """Test that duplicate category names are rejected."""
-        url = reverse("category-list")
-        data = {"name": "Politics"}
-        response = authenticated_client.post(url, data, format="json")
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-
-@pytest.mark.django_db
-class TestTagCreation:
-    """Test tag creation."""
-
-    def test_create_tag(self, authenticated_client):
-        """Test creating a tag."""
-        url = reverse("tag-list")
-        data = {"name": "football"}
-        response = authenticated_client.post(url, data, format="json")
-        assert response.status_code == status.HTTP_201_CREATED
-        assert response.data["name"] == "football"
-        assert response.data["slug"] == "football"
-        assert Tag.objects.filter(name="football").exists()
-
-    def test_create_tag_auto_slug(self, authenticated_client):
-        """Test that slug is auto-generated from name."""
-        url = reverse("tag-list")
-        data = {"name": "World Cup 2024"}
-        response = authenticated_client.post(url, data, format="json")
-        assert response.status_code == status.HTTP_201_CREATED
-        assert response.data["slug"] == "world-cup-2024"
+        url = CATEGORY_LIST_URL
+        response = authenticated_client.post(
+            url, _name_body("Politics"), content_type=JSON
+        )
+        assert response.status_code == HTTP_400_BAD_REQUEST
 
     def test_create_tag_duplicate_name_fails(self, authenticated_client, tag):
         """Test that duplicate tag names are rejected."""
-        url = reverse("tag-list")
-        data = {"name": "election"}
-        response = authenticated_client.post(url, data, format="json")
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        url = TAG_LIST_URL
+        response = authenticated_client.post(
+            url, _name_body("election"), content_type=JSON
+        )
+        assert response.status_code == HTTP_400_BAD_REQUEST
 
 
-@pytest.mark.django_db
 class TestPollFilteringByCategory:
     """Test filtering polls by category."""
 
-    def test_filter_by_category_slug(self, authenticated_client, user, category):
-        """Test filtering polls by category slug."""
-        poll1 = Poll.objects.create(title="Poll 1", category=category, created_by=user)
-        poll2 = Poll.objects.create(title="Poll 2", created_by=user)
-
-        url = reverse("poll-list")
-        response = authenticated_client.get(url, {"category": "politics"})
-
-        assert response.status_code == status.HTTP_200_OK
-        results = (
-            response.data["results"] if "results" in response.data else response.data
-        )
-        poll_ids = [p["id"] for p in results]
-        assert poll1.id in poll_ids
-        assert poll2.id not in poll_ids
-
-    def test_filter_by_category_id(self, authenticated_client, user, category):
-        """Test filtering polls by category ID."""
-        poll1 = Poll.objects.create(title="Poll 1", category=category, created_by=user)
-        poll2 = Poll.objects.create(title="Poll 2", created_by=user)
-
-        url = reverse("poll-list")
-        response = authenticated_client.get(url, {"category": str(category.id)})
-
-        assert response.status_code == status.HTTP_200_OK
-        results = (
-            response.data["results"] if "results" in response.data else response.data
-        )
-        poll_ids = [p["id"] for p in results]
-        assert poll1.id in poll_ids
-        assert poll2.id not in poll_ids
-
-    def test_filter_by_nonexistent_category(self, authenticated_client, user):
-        """Test filtering by non-existent category returns empty."""
-        Poll.objects.create(title="Poll 1", created_by=user)
-
-        url = reverse("poll-list")
-        response = authenticated_client.get(url, {"category": "nonexistent"})
+    @pytest.fixture(scope="class")
+    def polls(self, django_db_blocker, user, category):
+        """Create polls in two categories and one without, once per class.
+
+        "Politics" (``category``) holds poll1 and poll3, "Sports" holds poll4.
+        """
+        with django_db_blocker.unblock():
+            sports = Category.objects.create(name="Sports", slug="sports")
+            poll1, poll2, poll3, poll4 = Poll.objects.bulk_create(
+                [
+                    Poll(title="Poll 1", category=category, created_by=user),
+                    Poll(title="Poll 2", created_by=user),
+                    Poll(title="Poll 3", category=category, created_by=user),
+                    Poll(title="Poll 4", category=sports, created_by=user),
+                ]
+            )
+        yield {"poll1": poll1, "poll2": poll2, "poll3": poll3, "poll4": poll4}
+        with django_db_blocker.unblock():
+            # Cascades to poll4
+            sports.delete()
+            Poll.objects.filter(pk__in=[poll1.pk, poll2.pk, poll3.pk]).delete()
+
+    @pytest.mark.parametrize(
+        "category_param,expected",
+        [
+            (lambda category: category.slug, {"poll1", "poll3"}),
+            (lambda category: str(category.id), {"poll1", "poll3"}),
+            (lambda category: "nonexistent", set()),
+        ],
+        ids=["slug", "id", "nonexistent"],
+    )
+    def test_filter_by_category(
+        self,
+        authenticated_client,
+        assert_no_nplusone,
+        category,
+        polls,
+        category_param,
+        expected,
+    ):
+        """Test filtering polls by category slug or ID; unknown values match none."""
+        url = POLL_LIST_URL
+        with assert_no_nplusone(), CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.get(
+                url, {"category": category_param(category)}
+            )
+
+        assert response.status_code == HTTP_200_OK
+        assert len(ctx.captured_queries) <= CATEGORIZED_POLL_LIST_QUERY_BUDGET
+        poll_ids = {p["id"] for p in _results(response)}
+        assert poll_ids == {polls[name].id for name in expected}
+
+    def test_query_count_does_not_grow_with_polls(
+        self, authenticated_client, category, polls
+    ):
+        """Test that one, two or all polls over both categories cost the same queries."""
+        query_counts = []
+        for params in ({"category": "sports"}, {"category": category.slug}, {}):
+            with CaptureQueriesContext(connection) as ctx:
+                response = authenticated_client.get(POLL_LIST_URL, params)
+            assert response.status_code == HTTP_200_OK
+            query_counts.append(len(ctx.captured_queries))
 
-        assert response.status_code == status.HTTP_200_OK
-        results = (
-            response.data["results"] if "results" in response.data else response.data
-        )
-        assert len(results) == 0
+        assert len(set(query_counts)) == 1
+        assert query_counts[0] <= CATEGORIZED_POLL_LIST_QUERY_BUDGET
 
 
-@pytest.mark.django_db
 class TestPollFilteringByTags:
     """Test filtering polls by tags."""
 
-    def test_filter_by_single_tag(self, authenticated_client, user, tag):
-        """Test filtering polls by a single tag."""
-        poll1 = Poll.objects.create(title="Poll 1", created_by=user)
-        poll1.tags.add(tag)
-        poll2 = Poll.objects.create(title="Poll 2", created_by=user)
-
-        url = reverse("poll-list")
-        response = authenticated_client.get(url, {"tags": "election"})
-
-        assert response.status_code == status.HTTP_200_OK
-        results = (
-            response.data["results"] if "results" in response.data else response.data
-        )
-        poll_ids = [p["id"] for p in results]
-        assert poll1.id in poll_ids
-        assert poll2.id not in poll_ids
-
-    def test_filter_by_multiple_tags(self, authenticated_client, user):
-        """Test filtering polls by multiple tags (comma-separated)."""
-        tag1 = Tag.objects.create(name="election", slug="election")
-        tag2 = Tag.objects.create(name="presidential", slug="presidential")
-        poll1 = Poll.objects.create(title="Poll 1", created_by=user)
-        poll1.tags.add(tag1, tag2)
-        poll2 = Poll.objects.create(title="Poll 2", created_by=user)
-        poll2.tags.add(tag1)
-
-        url = reverse("poll-list")
-        response = authenticated_client.get(url, {"tags": "election,presidential"})
-
-        assert response.status_code == status.HTTP_200_OK
-        results = (
-            response.data["results"] if "results" in response.data else response.data
-        )
-        poll_ids = [p["id"] for p in results]
-        assert poll1.id in poll_ids
-        # poll2 should also appear since it has "election" tag
-        assert poll2.id in poll_ids
+    @pytest.fixture(scope="class")
+    def polls(self, django_db_blocker, user, tag):
+        """Create polls tagged "election", "presidential" and untagged, once per class."""
+        with django_db_blocker.unblock():
+            tag2 = Tag.objects.create(name="presidential", slug="presidential")
+            poll1, poll2, poll3 = Poll.objects.bulk_create(
+                [
+                    Poll(title="Poll 1", created_by=user),
+                    Poll(title="Poll 2", created_by=user),
+                    Poll(title="Poll 3", created_by=user),
+                ]
+            )
+            through = Poll.tags.through
+            through.objects.bulk_create(
+                [
+                    through(poll_id=poll1.pk, tag_id=tag.pk),
+                    through(poll_id=poll2.pk, tag_id=tag2.pk),
+                ]
+            )
+        yield {"poll1": poll1, "poll2": poll2, "poll3": poll3}
+        with django_db_blocker.unblock():
+            Poll.objects.filter(pk__in=[poll1.pk, poll2.pk, poll3.pk]).delete()
+            tag2.delete()
+
+    @pytest.mark.parametrize(
+        "tags_param,expected",
+        [
+            (lambda tag: "election", {"poll1"}),
+            (lambda tag: "election,presidential", {"poll1", "poll2"}),
+            (lambda tag: str(tag.id), {"poll1"}),
+        ],
+        ids=["single-slug", "multiple-slugs", "id"],
+    )
+    def test_filter_by_tags(
+        self, authenticated_client, tag, polls, tags_param, expected
+    ):
+        """Test filtering polls by tag slugs or IDs (comma-separated, any match)."""
+        url = POLL_LIST_URL
+        with CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.get(url, {"tags": tags_param(tag)})
 
-    def test_filter_by_tag_id(self, authenticated_client, user, tag):
-        """Test filtering polls by tag ID."""
-        poll1 = Poll.objects.create(title="Poll 1", created_by=user)
-        poll1.tags.add(tag)
-        poll2 = Poll.objects.create(title="Poll 2", created_by=user)
+        assert response.status_code == HTTP_200_OK
+        assert len(ctx.captured_queries) <= POLL_LIST_QUERY_BUDGET
+        poll_ids = {p["id"] for p in _results(response)}
+        assert poll_ids == {polls[name].id for name in expected}
 
-        url = reverse("poll-list")
-        response = authenticated_client.get(url, {"tags": str(tag.id)})
 
-        assert response.status_code == status.HTTP_200_OK
-        results = (
-            response.data["results"] if "results" in response.data else response.data
-        )
-        poll_ids = [p["id"] for p in results]
-        assert poll1.id in poll_ids
-        assert poll2.id not in poll_ids
-
-
-@pytest.mark.django_db
 class TestPollSearchByTags:
     """Test searching polls by tags."""
 
-    def test_search_by_tag_name(self, authenticated_client, user):
+    def test_search_by_tag_name(self, authenticated_client, tag, make_poll):
         """Test searching polls by tag name."""
-        tag1 = Tag.objects.create(name="election")
         tag2 = Tag.objects.create(name="presidential")
-        poll1 = Poll.objects.create(title="Poll 1", created_by=user)
-        poll1.tags.add(tag1, tag2)
-        poll2 = Poll.objects.create(title="Poll 2", created_by=user)
-        poll2.tags.add(tag1)
+        poll1 = make_poll(title="Poll 1", n_opts=0, tags=[tag, tag2])
+        poll2 = make_poll(title="Poll 2", n_opts=0, tags=[tag])
 
-        url = reverse("poll-list")
-        response = authenticated_client.get(url, {"search": "election"})
+        url = POLL_LIST_URL
+        with CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.get(url, {"search": "election"})
 
-        assert response.status_code == status.HTTP_200_OK
-        results = (
-            response.data["results"] if "results" in response.data else response.data
-        )
+        assert response.status_code == HTTP_200_OK
+        assert len(ctx.captured_queries) <= POLL_LIST_QUERY_BUDGET
+        results = _results(response)
         poll_ids = [p["id"] for p in results]
         assert poll1.id in poll_ids
         assert poll2.id in poll_ids
 
     def test_tag_search_case_insensitive(self, authenticated_client, user):
         """Test that tag search is case insensitive."""
-        tag = Tag.objects.create(name="Election")
+        tag = Tag.objects.create(name="Referendum")
         poll = Poll.objects.create(title="Poll 1", created_by=user)
-        poll.tags.add(tag)
+        Poll.tags.through.objects.create(poll_id=poll.id, tag_id=tag.id)
 
-        url = reverse("poll-list")
-        response = authenticated_client.get(url, {"search": "election"})
+        url = POLL_LIST_URL
+        response = authenticated_client.get(url, {"search": "referendum"})
 
-        assert response.status_code == status.HTTP_200_OK
-        results = (
-            response.data["results"] if "results" in response.data else response.data
-        )
+        assert response.status_code == HTTP_200_OK
+        results = _results(response)
         assert len(results) >= 1
 
     def test_tag_search_partial_match(self, authenticated_client, user):
         """Test that tag search supports partial matching."""
         tag = Tag.objects.create(name="presidential-election")
         poll = Poll.objects.create(title="Poll 1", created_by=user)
-        poll.tags.add(tag)
+        Poll.tags.through.objects.create(poll_id=poll.id, tag_id=tag.id)
 
-        url = reverse("poll-list")
+        url = POLL_LIST_URL
         response = authenticated_client.get(url, {"search": "presidential"})
 
-        assert response.status_code == status.HTTP_200_OK
-        results = (
-            response.data["results"] if "results" in response.data else response.data
-        )
+        assert response.status_code == HTTP_200_OK
+        results = _results(response)
         assert len(results) >= 1
 
 
-@pytest.mark.django_db
 class TestPollCreationWithCategoryAndTags:
     """Test creating polls with category and tags."""
 
     def test_create_poll_with_category(self, authenticated_client, user, category):
         """Test creating a poll with a category."""
-        url = reverse("poll-list")
-        data = {
-            "title": "Test Poll",
-            "description": "Test description",
-            "options": [
-                {"text": "Option 1"},
-                {"text": "Option 2"},
-            ],
-            "category": category.id,
-        }
-        response = authenticated_client.post(url, data, format="json")
-        assert response.status_code == status.HTTP_201_CREATED
+        url = POLL_LIST_URL
+        body = _poll_body(category_id=category.id)
+        response = authenticated_client.post(url, body, content_type=JSON)
+        assert response.status_code == HTTP_201_CREATED
         assert response.data["category"]["id"] == category.id
         assert response.data["category"]["name"] == "Politics"
 
@@ -296,18 +360,10 @@ class TestPollCreationWithCategoryAndTags:
     def test_create_poll_with_tags(self, authenticated_client, user, tag):
         """Test creating a poll with tags."""
         tag2 = Tag.objects.create(name="politics", slug="politics")
-        url = reverse("poll-list")
-        data = {
-            "title": "Test Poll",
-            "description": "Test description",
-            "options": [
-                {"text": "Option 1"},
-                {"text": "Option 2"},
-            ],
-            "tags": [tag.id, tag2.id],
-        }
-        response = authenticated_client.post(url, data, format="json")
-        assert response.status_code == status.HTTP_201_CREATED
+        url = POLL_LIST_URL
+        body = _poll_body(tag_ids=(tag.id, tag2.id))
+        response = authenticated_client.post(url, body, content_type=JSON)
+        assert response.status_code == HTTP_201_CREATED
         assert len(response.data["tags"]) == 2
         tag_ids = [t["id"] for t in response.data["tags"]]
         assert tag.id in tag_ids
@@ -323,86 +379,93 @@ class TestPollCreationWithCategoryAndTags:
         self, authenticated_client, user, category, tag
     ):
         """Test creating a poll with both category and tags."""
-        url = reverse("poll-list")
-        data = {
-            "title": "Test Poll",
-            "description": "Test description",
-            "options": [
-                {"text": "Option 1"},
-                {"text": "Option 2"},
-            ],
-            "category": category.id,
-            "tags": [tag.id],
-        }
-        response = authenticated_client.post(url, data, format="json")
-        assert response.status_code == status.HTTP_201_CREATED
+        url = POLL_LIST_URL
+        body = _poll_body(category_id=category.id, tag_ids=(tag.id,))
+        response = authenticated_client.post(url, body, content_type=JSON)
+        assert response.status_code == HTTP_201_CREATED
         assert response.data["category"]["id"] == category.id
         assert len(response.data["tags"]) == 1
         assert response.data["tags"][0]["id"] == tag.id
 
 
-@pytest.mark.django_db
 class TestCategoryViewSet:
     """Test CategoryViewSet endpoints."""
 
     def test_list_categories(self, authenticated_client, category):
         """Test listing all categories."""
         Category.objects.create(name="Sports", slug="sports")
-        url = reverse("category-list")
-        response = authenticated_client.get(url)
-        assert response.status_code == status.HTTP_200_OK
-        assert len(response.data["results"]) >= 2
+        url = CATEGORY_LIST_URL
+        with CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.get(url)
+        assert response.status_code == HTTP_200_OK
+        assert len(_results(response)) >= 2
+        assert len(ctx.captured_queries) <= LIST_QUERY_BUDGET
 
     def test_get_category_detail(self, authenticated_client, category):
         """Test getting a category detail."""
-        url = reverse("category-detail", kwargs={"pk": category.id})
+        url = CATEGORY_DETAIL_URL.format(category.id)
         response = authenticated_client.get(url)
-        assert response.status_code == status.HTTP_200_OK
+        assert response.status_code == HTTP_200_OK
         assert response.data["name"] == "Politics"
         assert response.data["poll_count"] == 0
 
-    def test_category_polls_endpoint(self, authenticated_client, user, category):
+    def test_category_polls_endpoint(
+        self, authenticated_client, assert_no_nplusone, user, category
+    ):
         """Test getting polls in a category."""
-        poll1 = Poll.objects.create(title="Poll 1", category=category, created_by=user)
-        poll2 = Poll.objects.create(title="Poll 2", created_by=user)
-
-        url = reverse("category-polls", kwargs={"pk": category.id})
-        response = authenticated_client.get(url)
-        assert response.status_code == status.HTTP_200_OK
+        (poll1,) = bulk_create_polls(1, created_by=user, category=category)
+        (poll2,) = bulk_create_polls(1, created_by=user)
+
+        url = CATEGORY_POLLS_URL.format(category.id)
+        with assert_no_nplusone(), CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.get(url)
+        assert response.status_code == HTTP_200_OK
+        assert len(ctx.captured_queries) <= CATEGORY_POLLS_QUERY_BUDGET
         poll_ids = [p["id"] for p in response.data]
         assert poll1.id in poll_ids
         assert poll2.id not in poll_ids
 
+        # More polls in the category must not add queries
+        bulk_create_polls(4, created_by=user, category=category)
+        with CaptureQueriesContext(connection) as more_ctx:
+            response = authenticated_client.get(url)
+        assert response.status_code == HTTP_200_OK
+        assert len(response.data) == 5
+        assert len(more_ctx.captured_queries) == len(ctx.captured_queries)
+
 
-@pytest.mark.django_db
 class TestTagViewSet:
     """Test TagViewSet endpoints."""
 
     def test_list_tags(self, authenticated_client, tag):
         """Test listing all tags."""
         Tag.objects.create(name="sports", slug="sports")
-        url = reverse("tag-list")
-        response = authenticated_client.get(url)
-        assert response.status_code == status.HTTP_200_OK
-        assert len(response.data["results"]) >= 2
+        url = TAG_LIST_URL
+        with CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.get(url)
+        assert response.status_code == HTTP_200_OK
+        assert len(_results(response)) >= 2
+        assert len(ctx.captured_queries) <= LIST_QUERY_BUDGET
 
     def test_get_tag_detail(self, authenticated_client, tag):
         """Test getting a tag detail."""
-        url = reverse("tag-detail", kwargs={"pk": tag.id})
+        url = TAG_DETAIL_URL.format(tag.id)
         response = authenticated_client.get(url)
-        assert response.status_code == status.HTTP_200_OK
+        assert response.status_code == HTTP_200_OK
         assert response.data["name"] == "election"
         assert response.data["poll_count"] == 0
 
-    def test_tag_polls_endpoint(self, authenticated_client, user, tag):
+    def test_tag_polls_endpoint(
+        self, authenticated_client, assert_no_nplusone, user, tag
+    ):
         """Test getting polls with a tag."""
-        poll1 = Poll.objects.create(title="Poll 1", created_by=user)
-        poll1.tags.add(tag)
-        poll2 = Poll.objects.create(title="Poll 2", created_by=user)
+        poll1, poll2 = bulk_create_polls(2, created_by=user)
+        Poll.tags.through.objects.create(poll_id=poll1.id, tag_id=tag.id)
 
-        url = reverse("tag-polls", kwargs={"pk": tag.id})
-        response = authenticated_client.get(url)
-        assert response.status_code == status.HTTP_200_OK
+        url = TAG_POLLS_URL.format(tag.id)
+        with assert_no_nplusone():
+            response = authenticated_client.get(url)
+        assert response.status_code == HTTP_200_OK
         poll_ids = [p["id"] for p in response.data]
         assert poll1.id in poll_ids
         assert poll2.id not in poll_ids
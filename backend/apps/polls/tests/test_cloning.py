@@ -7,40 +7,71 @@ from apps.polls.models import Poll, PollOption
 from apps.polls.services import clone_poll
 from apps.votes.models import Vote
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APIClient
 
+# clone_poll reads the original options once, then inserts the poll and all
+# of its options: three statements however many options there are.
+CLONE_QUERY_BUDGET = 3
+
+# The option texts make_poll generates for a ten-option poll
+OPTION_TEXTS = tuple(f"Option {i}" for i in range(1, 11))
+
+
+def _data_queries(ctx):
+    """Return captured queries minus the SAVEPOINT/RELEASE pair of atomic()."""
+    return [
+        query
+        for query in ctx.captured_queries
+        if not query["sql"].startswith(("SAVEPOINT", "RELEASE SAVEPOINT"))
+    ]
+
+
+# Cloning never modifies the poll owner, so one is shared by the module
+@pytest.fixture(scope="module")
+def user(module_user):
+    """Return the owner of the polls being cloned."""
+    return module_user
+
+
+@pytest.fixture(scope="module")
+def api_client():
+    """Create an unauthenticated API client, shared by the module."""
+    return APIClient()
+
+
+@pytest.fixture(scope="module")
+def authenticated_client(user):
+    """Create an API client authenticated as the poll owner, shared by the module."""
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
 
 @pytest.mark.django_db
 class TestPollCloning:
     """Test poll cloning functionality."""
 
-    def test_clone_poll_with_all_data(self, user):
+    def test_clone_poll_with_all_data(self, make_poll, user):
         """Test that poll is cloned with all options and data."""
         # Create original poll with options
-        original_poll = Poll.objects.create(
+        original_poll = make_poll(
             title="Original Poll",
             description="Original description",
-            created_by=user,
             settings={"show_results_during_voting": True},
             security_rules={"require_authentication": False},
-        )
-
-        _option1 = PollOption.objects.create(
-            poll=original_poll, text="Option 1", order=0
-        )
-        _option2 = PollOption.objects.create(
-            poll=original_poll, text="Option 2", order=1
-        )
-        _option3 = PollOption.objects.create(
-            poll=original_poll, text="Option 3", order=2
+            n_opts=3,
         )
 
         # Clone the poll
-        cloned_poll = clone_poll(
-            poll=original_poll,
-            user=user,
-        )
+        with CaptureQueriesContext(connection) as ctx:
+            cloned_poll = clone_poll(
+                poll=original_poll,
+                user=user,
+            )
+        assert len(_data_queries(ctx)) <= CLONE_QUERY_BUDGET
 
         # Verify cloned poll
         assert cloned_poll.title == "Copy of Original Poll"
@@ -52,63 +83,58 @@ class TestPollCloning:
         assert cloned_poll.cached_unique_voters == 0
 
         # Verify options are cloned
-        cloned_options = cloned_poll.options.all().order_by("order")
-        assert cloned_options.count() == 3
-        assert cloned_options[0].text == "Option 1"
-        assert cloned_options[0].order == 0
-        assert cloned_options[0].cached_vote_count == 0
-        assert cloned_options[1].text == "Option 2"
-        assert cloned_options[1].order == 1
-        assert cloned_options[2].text == "Option 3"
-        assert cloned_options[2].order == 2
+        cloned_options = list(
+            cloned_poll.options.order_by("order").values_list(
+                "text", "order", "cached_vote_count"
+            )
+        )
+        assert cloned_options == [
+            ("Option 1", 0, 0),
+            ("Option 2", 1, 0),
+            ("Option 3", 2, 0),
+        ]
 
         # Verify settings are cloned
         assert cloned_poll.settings == original_poll.settings
         assert cloned_poll.security_rules == original_poll.security_rules
 
-    def test_clone_poll_vote_counts_reset(self, user):
+    def test_clone_poll_vote_counts_reset(self, make_poll, user):
         """Test that vote counts are reset in cloned poll."""
         # Create original poll with votes
-        original_poll = Poll.objects.create(
-            title="Poll with Votes",
-            created_by=user,
-        )
-
-        option1 = PollOption.objects.create(
-            poll=original_poll, text="Option 1", order=0
-        )
-        option2 = PollOption.objects.create(
-            poll=original_poll, text="Option 2", order=1
-        )
+        original_poll = make_poll(title="Poll with Votes")
+        option1 = original_poll.options.get(order=0)
 
         # Create some votes
         user1 = User.objects.create_user(username="voter1", password="pass")
         user2 = User.objects.create_user(username="voter2", password="pass")
 
-        Vote.objects.create(
-            poll=original_poll,
-            option=option1,
-            user=user1,
-            voter_token="token1",
-            idempotency_key="key1",
-            is_valid=True,
-        )
-        Vote.objects.create(
-            poll=original_poll,
-            option=option1,
-            user=user2,
-            voter_token="token2",
-            idempotency_key="key2",
-            is_valid=True,
-        )
-
-        # Update cached counts
-        original_poll.update_cached_totals()
-        option1.update_cached_vote_count()
-
-        # Verify original has votes
-        assert original_poll.cached_total_votes == 2
-        assert option1.cached_vote_count == 2
+        Vote.objects.bulk_create(
+            [
+                Vote(
+                    poll=original_poll,
+                    option=option1,
+                    user=user1,
+                    voter_token="token1",
+                    idempotency_key="key1",
+                    is_valid=True,
+                ),
+                Vote(
+                    poll=original_poll,
+                    option=option1,
+                    user=user2,
+                    voter_token="token2",
+                    idempotency_key="key2",
+                    is_valid=True,
+                ),
+            ]
+        )
+
+        # Record the counts the votes above would produce
+        original_poll.cached_total_votes = 2
+        original_poll.cached_unique_voters = 2
+        original_poll.save(update_fields=["cached_total_votes", "cached_unique_voters"])
+        option1.cached_vote_count = 2
+        option1.save(update_fields=["cached_vote_count"])
 
         # Clone the poll
         cloned_poll = clone_poll(poll=original_poll, user=user)
@@ -124,40 +150,26 @@ class TestPollCloning:
         original_poll.refresh_from_db()
         assert original_poll.cached_total_votes == 2
 
-    def test_clone_poll_options_preserved(self, user):
+    def test_clone_poll_options_preserved(self, make_poll, user):
         """Test that all options are preserved in cloned poll."""
         # Create poll with many options
-        original_poll = Poll.objects.create(
-            title="Multi-Option Poll",
-            created_by=user,
-        )
-
-        options_texts = [f"Option {i}" for i in range(1, 11)]
-        for i, text in enumerate(options_texts):
-            PollOption.objects.create(poll=original_poll, text=text, order=i)
+        original_poll = make_poll(title="Multi-Option Poll", n_opts=len(OPTION_TEXTS))
 
         # Clone the poll
-        cloned_poll = clone_poll(poll=original_poll, user=user)
+        with CaptureQueriesContext(connection) as ctx:
+            cloned_poll = clone_poll(poll=original_poll, user=user)
+        assert len(_data_queries(ctx)) <= CLONE_QUERY_BUDGET
 
         # Verify all options are preserved
-        cloned_options = cloned_poll.options.all().order_by("order")
-        assert cloned_options.count() == 10
-
-        for i, option in enumerate(cloned_options):
-            assert option.text == options_texts[i]
-            assert option.order == i
+        cloned_options = list(
+            cloned_poll.options.order_by("order").values_list("text", "order")
+        )
+        assert cloned_options == [(text, i) for i, text in enumerate(OPTION_TEXTS)]
 
-    def test_clone_poll_independent(self, user):
+    def test_clone_poll_independent(self, make_poll, user):
         """Test that cloned poll is independent from original."""
         # Create original poll
-        original_poll = Poll.objects.create(
-            title="Original",
-            description="Original description",
-            created_by=user,
-        )
-
-        PollOption.objects.create(poll=original_poll, text="Option 1", order=0)
-        PollOption.objects.create(poll=original_poll, text="Option 2", order=1)
+        original_poll = make_poll(title="Original", description="Original description")
 
         # Clone the poll
         cloned_poll = clone_poll(poll=original_poll, user=user)
@@ -181,15 +193,9 @@ class TestPollCloning:
         assert cloned_poll.description == "Modified description"
         assert cloned_poll.options.count() == 3
 
-    def test_clone_poll_custom_title(self, user):
+    def test_clone_poll_custom_title(self, make_poll, user):
         """Test cloning with custom title."""
-        original_poll = Poll.objects.create(
-            title="Original Poll",
-            created_by=user,
-        )
-
-        PollOption.objects.create(poll=original_poll, text="Option 1", order=0)
-        PollOption.objects.create(poll=original_poll, text="Option 2", order=1)
+        original_poll = make_poll(title="Original Poll")
 
         # Clone with custom title
         cloned_poll = clone_poll(
@@ -201,18 +207,14 @@ class TestPollCloning:
         assert cloned_poll.title == "My Custom Title"
         assert cloned_poll.title != "Copy of Original Poll"
 
-    def test_clone_poll_without_settings(self, user):
+    def test_clone_poll_without_settings(self, make_poll, user):
         """Test cloning without settings."""
-        original_poll = Poll.objects.create(
+        original_poll = make_poll(
             title="Original",
-            created_by=user,
             settings={"key": "value"},
             security_rules={"rule": "value"},
         )
 
-        PollOption.objects.create(poll=original_poll, text="Option 1", order=0)
-        PollOption.objects.create(poll=original_poll, text="Option 2", order=1)
-
         # Clone without settings
         cloned_poll = clone_poll(
             poll=original_poll,
@@ -224,11 +226,10 @@ class TestPollCloning:
         assert cloned_poll.settings == {}
         assert cloned_poll.security_rules == {}
 
-    def test_clone_poll_with_settings(self, user):
+    def test_clone_poll_with_settings(self, make_poll, user):
         """Test cloning with settings."""
-        original_poll = Poll.objects.create(
+        original_poll = make_poll(
             title="Original",
-            created_by=user,
             settings={
                 "show_results_during_voting": True,
                 "allow_multiple_votes": False,
@@ -236,9 +237,6 @@ class TestPollCloning:
             security_rules={"require_authentication": True},
         )
 
-        PollOption.objects.create(poll=original_poll, text="Option 1", order=0)
-        PollOption.objects.create(poll=original_poll, text="Option 2", order=1)
-
         # Clone with settings
         cloned_poll = clone_poll(
             poll=original_poll,
@@ -250,15 +248,9 @@ class TestPollCloning:
         assert cloned_poll.settings == original_poll.settings
         assert cloned_poll.security_rules == original_poll.security_rules
 
-    def test_clone_poll_as_published(self, user):
+    def test_clone_poll_as_published(self, make_poll, user):
         """Test cloning poll as published (not draft)."""
-        original_poll = Poll.objects.create(
-            title="Original",
-            created_by=user,
-        )
-
-        PollOption.objects.create(poll=original_poll, text="Option 1", order=0)
-        PollOption.objects.create(poll=original_poll, text="Option 2", order=1)
+        original_poll = make_poll(title="Original")
 
         # Clone as published
         cloned_poll = clone_poll(
@@ -269,28 +261,19 @@ class TestPollCloning:
 
         assert cloned_poll.is_draft is False
 
-    def test_clone_poll_no_options_fails(self, user):
+    def test_clone_poll_no_options_fails(self, make_poll, user):
         """Test that cloning poll without options fails."""
-        original_poll = Poll.objects.create(
-            title="Poll Without Options",
-            created_by=user,
-        )
+        original_poll = make_poll(title="Poll Without Options", n_opts=0)
 
         # Try to clone poll without options
         with pytest.raises(ValueError, match="no options"):
             clone_poll(poll=original_poll, user=user)
 
-    def test_clone_poll_title_truncation(self, user):
+    def test_clone_poll_title_truncation(self, make_poll, user):
         """Test that long titles are truncated when adding 'Copy of' prefix."""
         # Create poll with very long title
         long_title = "A" * 195  # 195 characters
-        original_poll = Poll.objects.create(
-            title=long_title,
-            created_by=user,
-        )
-
-        PollOption.objects.create(poll=original_poll, text="Option 1", order=0)
-        PollOption.objects.create(poll=original_poll, text="Option 2", order=1)
+        original_poll = make_poll(title=long_title)
 
         # Clone without custom title (should truncate)
         cloned_poll = clone_poll(poll=original_poll, user=user)
@@ -303,23 +286,16 @@ class TestPollCloning:
 class TestPollCloningAPI:
     """Test poll cloning API endpoint."""
 
-    def test_clone_poll_via_api(self, user):
+    def test_clone_poll_via_api(self, make_poll, authenticated_client):
         """Test cloning poll via API endpoint."""
         # Create original poll
-        original_poll = Poll.objects.create(
+        original_poll = make_poll(
             title="Original Poll",
             description="Original description",
-            created_by=user,
         )
 
-        PollOption.objects.create(poll=original_poll, text="Option 1", order=0)
-        PollOption.objects.create(poll=original_poll, text="Option 2", order=1)
-
-        client = APIClient()
-        client.force_authenticate(user=user)
-
         # Clone via API
-        response = client.post(f"/api/v1/polls/{original_poll.id}/clone/")
+        response = authenticated_client.post(f"/api/v1/polls/{original_poll.id}/clone/")
 
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data["message"] == "Poll cloned successfully"
@@ -331,21 +307,14 @@ class TestPollCloningAPI:
         assert cloned_data["is_draft"] is True
         assert len(cloned_data["options"]) == 2
 
-    def test_clone_poll_with_custom_title_via_api(self, user):
+    def test_clone_poll_with_custom_title_via_api(
+        self, make_poll, authenticated_client
+    ):
         """Test cloning poll with custom title via API."""
-        original_poll = Poll.objects.create(
-            title="Original",
-            created_by=user,
-        )
-
-        PollOption.objects.create(poll=original_poll, text="Option 1", order=0)
-        PollOption.objects.create(poll=original_poll, text="Option 2", order=1)
-
-        client = APIClient()
-        client.force_authenticate(user=user)
+        original_poll = make_poll(title="Original")
 
         # Clone with custom title
-        response = client.post(
+        response = authenticated_client.post(
             f"/api/v1/polls/{original_poll.id}/clone/",
             {"new_title": "My Custom Clone"},
             format="json",
@@ -354,21 +323,11 @@ class TestPollCloningAPI:
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data["poll"]["title"] == "My Custom Clone"
 
-    def test_clone_poll_with_options_via_api(self, user):
+    def test_clone_poll_with_options_via_api(self, make_poll, authenticated_client):
         """Test cloning poll with options preserved via API."""
-        original_poll = Poll.objects.create(
-            title="Original",
-            created_by=user,
-        )
-
-        PollOption.objects.create(poll=original_poll, text="Option 1", order=0)
-        PollOption.objects.create(poll=original_poll, text="Option 2", order=1)
-        PollOption.objects.create(poll=original_poll, text="Option 3", order=2)
+        original_poll = make_poll(title="Original", n_opts=3)
 
-        client = APIClient()
-        client.force_authenticate(user=user)
-
-        response = client.post(f"/api/v1/polls/{original_poll.id}/clone/")
+        response = authenticated_client.post(f"/api/v1/polls/{original_poll.id}/clone/")
 
         assert response.status_code == status.HTTP_201_CREATED
         cloned_options = response.data["poll"]["options"]
@@ -377,17 +336,13 @@ class TestPollCloningAPI:
         assert cloned_options[1]["text"] == "Option 2"
         assert cloned_options[2]["text"] == "Option 3"
 
-    def test_clone_poll_vote_counts_reset_via_api(self, user):
+    def test_clone_poll_vote_counts_reset_via_api(
+        self, make_poll, authenticated_client, user
+    ):
         """Test that vote counts are reset in cloned poll via API."""
         # Create poll with votes
-        original_poll = Poll.objects.create(
-            title="Poll with Votes",
-            created_by=user,
-        )
-
-        option1 = PollOption.objects.create(
-            poll=original_poll, text="Option 1", order=0
-        )
+        original_poll = make_poll(title="Poll with Votes", n_opts=1)
+        option1 = original_poll.options.get(order=0)
 
         # Create votes
         user1 = User.objects.create_user(username="voter1", password="pass")
@@ -400,38 +355,29 @@ class TestPollCloningAPI:
             is_valid=True,
         )
 
-        original_poll.update_cached_totals()
-
-        client = APIClient()
-        client.force_authenticate(user=user)
+        original_poll.cached_total_votes = 1
+        original_poll.cached_unique_voters = 1
+        original_poll.save(update_fields=["cached_total_votes", "cached_unique_voters"])
 
-        response = client.post(f"/api/v1/polls/{original_poll.id}/clone/")
+        response = authenticated_client.post(f"/api/v1/polls/{original_poll.id}/clone/")
 
         assert response.status_code == status.HTTP_201_CREATED
         cloned_data = response.data["poll"]
         assert cloned_data["total_votes"] == 0
         assert cloned_data["unique_voters"] == 0
 
-    def test_clone_poll_independent_via_api(self, user):
+    def test_clone_poll_independent_via_api(self, make_poll, authenticated_client):
         """Test that cloned poll is independent via API."""
-        original_poll = Poll.objects.create(
-            title="Original",
-            created_by=user,
-        )
-
-        PollOption.objects.create(poll=original_poll, text="Option 1", order=0)
-
-        client = APIClient()
-        client.force_authenticate(user=user)
+        original_poll = make_poll(title="Original", n_opts=1)
 
         # Clone the poll
-        response = client.post(f"/api/v1/polls/{original_poll.id}/clone/")
+        response = authenticated_client.post(f"/api/v1/polls/{original_poll.id}/clone/")
         assert response.status_code == status.HTTP_201_CREATED
 
         cloned_poll_id = response.data["poll"]["id"]
 
         # Modify cloned poll
-        update_response = client.patch(
+        update_response = authenticated_client.patch(
             f"/api/v1/polls/{cloned_poll_id}/",
             {"title": "Modified Clone"},
             format="json",
@@ -439,38 +385,27 @@ class TestPollCloningAPI:
         assert update_response.status_code == status.HTTP_200_OK
 
         # Verify original is unchanged
-        original_response = client.get(f"/api/v1/polls/{original_poll.id}/")
+        original_response = authenticated_client.get(
+            f"/api/v1/polls/{original_poll.id}/"
+        )
         assert original_response.data["title"] == "Original"
 
-    def test_clone_poll_without_options_fails_via_api(self, user):
+    def test_clone_poll_without_options_fails_via_api(
+        self, make_poll, authenticated_client
+    ):
         """Test that cloning poll without options fails via API."""
-        original_poll = Poll.objects.create(
-            title="Poll Without Options",
-            created_by=user,
-        )
+        original_poll = make_poll(title="Poll Without Options", n_opts=0)
 
-        client = APIClient()
-        client.force_authenticate(user=user)
-
-        response = client.post(f"/api/v1/polls/{original_poll.id}/clone/")
+        response = authenticated_client.post(f"/api/v1/polls/{original_poll.id}/clone/")
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "no options" in response.data["error"].lower()
 
-    def test_clone_poll_requires_authentication(self, user):
+    def test_clone_poll_requires_authentication(self, make_poll, api_client):
         """Test that cloning requires authentication."""
-        original_poll = Poll.objects.create(
-            title="Original",
-            created_by=user,
-        )
-
-        PollOption.objects.create(poll=original_poll, text="Option 1", order=0)
-        PollOption.objects.create(poll=original_poll, text="Option 2", order=1)
-
-        client = APIClient()
-        # Not authenticated
+        original_poll = make_poll(title="Original")
 
-        response = client.post(f"/api/v1/polls/{original_poll.id}/clone/")
+        response = api_client.post(f"/api/v1/polls/{original_poll.id}/clone/")
 
         # Permission class returns 403 for unauthenticated users
         assert response.status_code in [
@@ -478,23 +413,18 @@ class TestPollCloningAPI:
             status.HTTP_403_FORBIDDEN,
         ]
 
-    def test_clone_poll_with_settings_options_via_api(self, user):
+    def test_clone_poll_with_settings_options_via_api(
+        self, make_poll, authenticated_client
+    ):
         """Test cloning with settings options via API."""
-        original_poll = Poll.objects.create(
+        original_poll = make_poll(
             title="Original",
-            created_by=user,
             settings={"key": "value"},
             security_rules={"rule": "value"},
         )
 
-        PollOption.objects.create(poll=original_poll, text="Option 1", order=0)
-        PollOption.objects.create(poll=original_poll, text="Option 2", order=1)
-
-        client = APIClient()
-        client.force_authenticate(user=user)
-
         # Clone without settings
-        response = client.post(
+        response = authenticated_client.post(
             f"/api/v1/polls/{original_poll.id}/clone/",
             {
                 "clone_settings": False,
@@ -3,155 +3,150 @@ Tests for export functionality.
 """
 
 from datetime import timedelta
+from io import BytesIO
 from unittest.mock import MagicMock, patch
 
 import pytest
 from apps.analytics.models import AuditLog
 from apps.polls.models import Poll, PollOption
 from apps.votes.models import Vote
+from core.services.export_service import export_poll_results_pdf
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
 
-
-@pytest.mark.django_db
-class TestPollResultsExport:
-    """Test poll results export in various formats."""
-
-    def test_export_csv_format_generates_correctly(self, user, poll, choices):
-        """Test that CSV export generates correctly."""
-
-        # Ensure poll is owned by user and results are visible
-        poll.created_by = user
-        poll.settings["show_results_during_voting"] = True
-        poll.save()
-
-        # Create votes
-        user1 = User.objects.create_user(
-            username="user1_1763649008_fd45023a", password="pass"
+# Stands in for the ReportLab output in tests that only check the view's
+# response. TestPdfRendering and the permission tests still render real PDFs.
+STUB_PDF = b"%PDF-1.4\n%stub\n"
+
+# Resolved once at import; filled in with str.format(poll.id)
+RESULTS_EXPORT_URL = reverse("poll-results-export", kwargs={"pk": 0}).replace(
+    "/0/", "/{}/"
+)
+
+# Vote log export queries, independent of the number of votes: the poll
+# lookups, the requesting user, the vote count, the audit log insert, and one
+# SELECT for the votes with their users and options joined in.
+VOTE_LOG_QUERY_BUDGET = 7
+
+
+@pytest.fixture(scope="module")
+def single_vote_poll(django_db_setup, django_db_blocker):
+    """Create a poll with visible results and one vote, shared by the module.
+
+    The poll's owner is ``poll.created_by``. Tests only read these rows; the
+    rows a test writes itself are still rolled back by ``django_db``.
+    """
+    with django_db_blocker.unblock():
+        owner = User.objects.create_user(username="export_owner", password=None)
+        voter = User.objects.create_user(username="export_voter", password=None)
+        poll = Poll.objects.create(
+            title="Export Poll",
+            created_by=owner,
+            is_active=True,
+            starts_at=timezone.now(),
+            settings={"show_results_during_voting": True},
+        )
+        option, _ = PollOption.objects.bulk_create(
+            [
+                PollOption(poll=poll, text="Choice 1", order=0),
+                PollOption(poll=poll, text="Choice 2", order=1),
+            ]
         )
         Vote.objects.create(
-            user=user1,
+            user=voter,
             poll=poll,
-            option=choices[0],
-            voter_token="token1",
-            idempotency_key="key1",
+            option=option,
+            voter_token="export_token",
+            idempotency_key="export_key",
             is_valid=True,
         )
+    yield poll
+    with django_db_blocker.unblock():
+        User.objects.filter(pk__in=[owner.pk, voter.pk]).delete()
 
-        # Refresh poll to update cached counts
-        poll.refresh_from_db()
-        choices[0].refresh_from_db()
 
-        client = APIClient()
-        client.force_authenticate(user=user)
+@pytest.fixture(scope="module")
+def owner_client(single_vote_poll):
+    """Create an API client authenticated as the owner of ``single_vote_poll``."""
+    client = APIClient()
+    client.force_authenticate(user=single_vote_poll.created_by)
+    return client
 
-        # Use reverse to get the correct URL for the action
-        url = reverse("poll-results-export", kwargs={"pk": poll.id})
-        response = client.get(f"{url}?export_format=csv")
 
-        assert response.status_code == status.HTTP_200_OK
-        assert response["Content-Type"] == "text/csv"
-        assert "attachment" in response["Content-Disposition"]
-        assert f"poll_{poll.id}_results.csv" in response["Content-Disposition"]
+@pytest.fixture
+def admin_client(db):
+    """Create an API client authenticated as a staff superuser."""
+    admin_user = User.objects.create_user(
+        username="admin", password=None, is_staff=True, is_superuser=True
+    )
+    client = APIClient()
+    client.force_authenticate(user=admin_user)
+    return client
 
-        # Check CSV content
-        content = response.content.decode("utf-8")
-        assert "Poll Results" in content
-        assert poll.title in content
-        # CSV format uses: Option,Votes,Percentage (not "Option ID" or "Option Text")
-        assert "Option" in content
-        assert "Votes" in content
-        assert "Percentage" in content
 
-    def test_export_json_format_generates_correctly(self, user, poll, choices):
-        """Test that JSON export generates correctly."""
-
-        # Ensure poll is owned by user and results are visible
-        poll.created_by = user
-        poll.settings["show_results_during_voting"] = True
-        poll.save()
-
-        # Create votes
-        user1 = User.objects.create_user(
-            username="user1_1763649008_fd45023a", password="pass"
-        )
-        Vote.objects.create(
-            user=user1,
-            poll=poll,
-            option=choices[0],
-            voter_token="token1",
-            idempotency_key="key1",
-            is_valid=True,
-        )
-
-        # Refresh poll to update cached counts
-        poll.refresh_from_db()
-        choices[0].refresh_from_db()
-
-        client = APIClient()
-        client.force_authenticate(user=user)
-
-        response = client.get(
-            f"/api/v1/polls/{poll.id}/export-results/?export_format=json"
-        )
-
-        assert response.status_code == status.HTTP_200_OK
-        assert "poll_id" in response.data
+def _assert_results_export(export_format, response, poll, mock_pdf):
+    """Check the format-specific body of a poll results export."""
+    if export_format == "json":
         assert response.data["poll_id"] == poll.id
         assert "options" in response.data
         assert "total_votes" in response.data
+        return
 
-    def test_export_pdf_format_generates_correctly(self, user, poll, choices):
-        """Test that PDF export generates correctly."""
+    assert "attachment" in response["Content-Disposition"]
+    assert f"poll_{poll.id}_results.{export_format}" in response["Content-Disposition"]
 
-        # Ensure poll is owned by user and results are visible
-        poll.created_by = user
-        poll.settings["show_results_during_voting"] = True
-        poll.save()
+    body = response.content
+    if export_format == "pdf":
+        # The rendered PDF is returned as the response body
+        assert body == STUB_PDF
+        mock_pdf.assert_called_once_with(poll.id)
+        return
 
-        # Create votes
-        user1 = User.objects.create_user(
-            username="user1_1763649008_fd45023a", password="pass"
-        )
-        Vote.objects.create(
-            user=user1,
-            poll=poll,
-            option=choices[0],
-            voter_token="token1",
-            idempotency_key="key1",
-            is_valid=True,
-        )
+    assert b"Poll Results" in body
+    assert poll.title.encode() in body
+    # CSV format uses: Option,Votes,Percentage (not "Option ID" or "Option Text")
+    assert b"Option" in body
+    assert b"Votes" in body
+    assert b"Percentage" in body
 
-        # Refresh poll to update cached counts
-        poll.refresh_from_db()
-        choices[0].refresh_from_db()
 
-        client = APIClient()
-        client.force_authenticate(user=user)
+@pytest.mark.django_db
+class TestPollResultsExport:
+    """Test poll results export in various formats."""
 
-        # Use reverse to get the correct URL for the action
-        url = reverse("poll-results-export", kwargs={"pk": poll.id})
-        try:
-            response = client.get(f"{url}?export_format=pdf")
+    @pytest.mark.parametrize(
+        "export_format,content_type",
+        [
+            ("csv", "text/csv"),
+            ("json", "application/json"),
+            ("pdf", "application/pdf"),
+        ],
+    )
+    @patch("apps.polls.views.export_poll_results_pdf")
+    def test_export_format_generates_correctly(
+        self, mock_pdf, export_format, content_type, single_vote_poll, owner_client
+    ):
+        """Test that each results export format generates correctly."""
+        mock_pdf.side_effect = lambda poll_id: BytesIO(STUB_PDF)
 
-            # If reportlab is not installed, should return 503
-            if response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE:
-                pytest.skip("reportlab not installed")
+        poll = single_vote_poll
 
-            assert response.status_code == status.HTTP_200_OK
-            assert response["Content-Type"] == "application/pdf"
-            assert "attachment" in response["Content-Disposition"]
-            assert f"poll_{poll.id}_results.pdf" in response["Content-Disposition"]
+        response = owner_client.get(
+            RESULTS_EXPORT_URL.format(poll.id), {"export_format": export_format}
+        )
 
-            # Check PDF content starts with PDF header
-            assert response.content[:4] == b"%PDF"
-        except ImportError:
-            pytest.skip("reportlab not installed")
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == content_type
+        _assert_results_export(export_format, response, poll, mock_pdf)
 
-    def test_export_contains_correct_data(self, user, poll, choices):
+    def test_export_contains_correct_data(
+        self, user, poll, choices, authenticated_client
+    ):
         """Test that exports contain correct data."""
 
         # Ensure poll is owned by user and results are visible
@@ -188,11 +183,8 @@ class TestPollResultsExport:
         poll.refresh_from_db()
         choices[0].refresh_from_db()
 
-        client = APIClient()
-        client.force_authenticate(user=user)
-
-        response = client.get(
-            f"/api/v1/polls/{poll.id}/export-results/?export_format=json"
+        response = authenticated_client.get(
+            RESULTS_EXPORT_URL.format(poll.id), {"export_format": "json"}
         )
 
         assert response.status_code == status.HTTP_200_OK
@@ -202,48 +194,71 @@ class TestPollResultsExport:
         assert "options" in response.data
 
 
+@pytest.mark.django_db
+class TestPdfRendering:
+    """Test ReportLab rendering, which the view tests replace with STUB_PDF."""
+
+    def test_export_poll_results_pdf_renders(self, single_vote_poll):
+        """Test that poll results render to a PDF document."""
+        pytest.importorskip("reportlab")
+
+        buffer = export_poll_results_pdf(single_vote_poll.id)
+
+        assert buffer.getvalue()[:4] == b"%PDF"
+
+
 @pytest.mark.django_db
 class TestVoteLogExport:
     """Test vote log export functionality."""
 
-    def test_export_vote_log_csv(self, user, poll, choices):
+    def test_export_vote_log_csv(self, user, poll, choices, authenticated_client):
         """Test exporting vote log as CSV."""
 
         # Make user poll owner first
         poll.created_by = user
         poll.save()
 
-        # Create votes
-        user1 = User.objects.create_user(
-            username="user1_1763649008_fd45023a", password="pass"
-        )
-        Vote.objects.create(
-            user=user1,
-            poll=poll,
-            option=choices[0],
-            voter_token="token1",
-            idempotency_key="key1",
-            ip_address="192.168.1.1",
-            user_agent="Test Agent",
-            is_valid=True,
-        )
-
-        client = APIClient()
-        client.force_authenticate(user=user)
-
-        response = client.get(
-            f"/api/v1/polls/{poll.id}/export-vote-log/?export_format=csv"
-        )
+        # Create votes from different users on different options, so a
+        # per-row user or option lookup would show up in the query count
+        voters = User.objects.bulk_create(
+            [
+                User(username=f"user{i}_1763649008_fd45023a", password="!")
+                for i in (1, 2)
+            ]
+        )
+        Vote.objects.bulk_create(
+            [
+                Vote(
+                    user=voter,
+                    poll=poll,
+                    option=option,
+                    voter_token=f"token{i}",
+                    idempotency_key=f"key{i}",
+                    ip_address="192.168.1.1",
+                    user_agent="Test Agent",
+                    is_valid=True,
+                )
+                for i, (voter, option) in enumerate(zip(voters, choices), start=1)
+            ]
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.get(
+                f"/api/v1/polls/{poll.id}/export-vote-log/?export_format=csv"
+            )
+            body = b"".join(response.streaming_content)
 
         assert response.status_code == status.HTTP_200_OK
         assert response["Content-Type"] == "text/csv"
+        assert len(ctx.captured_queries) <= VOTE_LOG_QUERY_BUDGET
 
-        content = response.content.decode("utf-8")
-        assert "Vote Log Export" in content
-        assert "user1" in content
-        assert "192.168.1.1" in content
+        assert b"Vote Log Export" in body
+        assert b"user1" in body
+        assert b"192.168.1.1" in body
 
-    def test_export_vote_log_anonymized(self, user, poll, choices):
+    def test_export_vote_log_anonymized(
+        self, user, poll, choices, authenticated_client
+    ):
         """Test that anonymization works in vote log export."""
 
         # Make user poll owner first
@@ -265,23 +280,23 @@ class TestVoteLogExport:
             is_valid=True,
         )
 
-        client = APIClient()
-        client.force_authenticate(user=user)
-
-        response = client.get(
+        response = authenticated_client.get(
             f"/api/v1/polls/{poll.id}/export-vote-log/?export_format=csv&anonymize=true"
         )
 
         assert response.status_code == status.HTTP_200_OK
 
-        content = response.content.decode("utf-8")
-        assert "Vote Log Export" in content
+        # The whole body is needed to show the username never appears, but it
+        # is searched as bytes rather than decoded
+        body = b"".join(response.streaming_content)
+        assert b"Vote Log Export" in body
         # Check that IP is anonymized
-        assert "192.168.1.xxx" in content or "xxx" in content
+        assert b"192.168.1.xxx" in body
+        assert b"192.168.1.1" not in body
         # Check that username is not present (anonymized)
-        assert "user1" not in content
+        assert b"user1" not in body
 
-    def test_export_vote_log_json(self, user, poll, choices):
+    def test_export_vote_log_json(self, user, poll, choices, authenticated_client):
         """Test exporting vote log as JSON."""
 
         # Make user poll owner first
@@ -301,10 +316,7 @@ class TestVoteLogExport:
             is_valid=True,
         )
 
-        client = APIClient()
-        client.force_authenticate(user=user)
-
-        response = client.get(
+        response = authenticated_client.get(
             f"/api/v1/polls/{poll.id}/export-vote-log/?export_format=json"
         )
 
@@ -331,8 +343,12 @@ class TestVoteLogExport:
 class TestAnalyticsReportExport:
     """Test analytics report export."""
 
-    def test_export_analytics_report_pdf(self, user, poll, choices):
+    @patch("apps.polls.views.export_analytics_report_pdf")
+    def test_export_analytics_report_pdf(
+        self, mock_pdf, user, poll, choices, authenticated_client
+    ):
         """Test exporting analytics report as PDF."""
+        mock_pdf.side_effect = lambda poll_id: BytesIO(STUB_PDF)
 
         # Create votes
         user1 = User.objects.create_user(
@@ -351,25 +367,18 @@ class TestAnalyticsReportExport:
         poll.created_by = user
         poll.save()
 
-        client = APIClient()
-        client.force_authenticate(user=user)
-
-        try:
-            response = client.get(f"/api/v1/polls/{poll.id}/export-analytics/")
-
-            # If reportlab is not installed, should return 503
-            if response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE:
-                pytest.skip("reportlab not installed")
+        response = authenticated_client.get(
+            f"/api/v1/polls/{poll.id}/export-analytics/"
+        )
 
-            assert response.status_code == status.HTTP_200_OK
-            assert response["Content-Type"] == "application/pdf"
-            assert "attachment" in response["Content-Disposition"]
-            assert f"poll_{poll.id}_analytics.pdf" in response["Content-Disposition"]
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/pdf"
+        assert "attachment" in response["Content-Disposition"]
+        assert f"poll_{poll.id}_analytics.pdf" in response["Content-Disposition"]
 
-            # Check PDF content
-            assert response.content[:4] == b"%PDF"
-        except ImportError:
-            pytest.skip("reportlab not installed")
+        # The rendered PDF is returned as the response body
+        assert response.content == STUB_PDF
+        mock_pdf.assert_called_once_with(poll.id)
 
     def test_export_analytics_permissions_enforced(self, user, poll, choices):
         """Test that analytics export permissions are enforced."""
@@ -388,13 +397,8 @@ class TestAnalyticsReportExport:
 class TestAuditTrailExport:
     """Test audit trail export."""
 
-    def test_export_audit_trail_csv(self, user, poll):
+    def test_export_audit_trail_csv(self, user, poll, admin_client):
         """Test exporting audit trail as CSV."""
-        # Create admin user
-        admin_user = User.objects.create_user(
-            username="admin", password="pass", is_staff=True, is_superuser=True
-        )
-
         # Create audit log
         AuditLog.objects.create(
             method="GET",
@@ -406,74 +410,59 @@ class TestAuditTrailExport:
             user_agent="Test Agent",
         )
 
-        client = APIClient()
-        client.force_authenticate(user=admin_user)
-
-        response = client.get(
+        response = admin_client.get(
             f"/api/v1/polls/{poll.id}/export-audit-trail/?export_format=csv"
         )
 
         assert response.status_code == status.HTTP_200_OK
         assert response["Content-Type"] == "text/csv"
 
-        content = response.content.decode("utf-8")
-        assert "Audit Trail Export" in content
+        body = response.content
+        assert b"Audit Trail Export" in body
         # CSV format uses: ID,Timestamp,Method,Path,User,IP Address,Status Code,Response Time (s)
-        assert "ID" in content
-        assert "Timestamp" in content
-        assert "Method" in content
-        assert "Path" in content
+        assert b"ID" in body
+        assert b"Timestamp" in body
+        assert b"Method" in body
+        assert b"Path" in body
 
-    def test_export_audit_trail_requires_admin(self, user, poll):
+    def test_export_audit_trail_requires_admin(self, user, poll, authenticated_client):
         """Test that audit trail export requires admin."""
         # Make user poll owner but not admin
         poll.created_by = user
         poll.save()
 
-        client = APIClient()
-        client.force_authenticate(user=user)
-
-        response = client.get(f"/api/v1/polls/{poll.id}/export-audit-trail/")
+        response = authenticated_client.get(
+            f"/api/v1/polls/{poll.id}/export-audit-trail/"
+        )
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
-    def test_export_audit_trail_date_filtering(self, user, poll):
+    def test_export_audit_trail_date_filtering(self, user, poll, admin_client):
         """Test that audit trail export respects date filtering."""
-        # Create admin user
-        admin_user = User.objects.create_user(
-            username="admin", password="pass", is_staff=True, is_superuser=True
-        )
-
         now = timezone.now()
 
-        # Create old audit log
-        AuditLog.objects.create(
-            method="GET",
-            path=f"/api/v1/polls/{poll.id}/",
-            user=user,
-            ip_address="192.168.1.1",
-            status_code=200,
-            response_time=0.1,
-            created_at=now - timedelta(days=10),
-        )
-
-        # Create recent audit log
-        AuditLog.objects.create(
-            method="POST",
-            path=f"/api/v1/polls/{poll.id}/",
-            user=user,
-            ip_address="192.168.1.1",
-            status_code=200,
-            response_time=0.2,
-            created_at=now - timedelta(days=1),
+        # created_at is auto_now_add and ignores values passed on insert, so
+        # both logs are inserted together and the old one is backdated after.
+        old_log, _ = AuditLog.objects.bulk_create(
+            [
+                AuditLog(
+                    method=method,
+                    path=f"/api/v1/polls/{poll.id}/",
+                    user=user,
+                    ip_address="192.168.1.1",
+                    status_code=200,
+                    response_time=response_time,
+                )
+                for method, response_time in (("GET", 0.1), ("POST", 0.2))
+            ]
+        )
+        AuditLog.objects.filter(pk=old_log.pk).update(
+            created_at=now - timedelta(days=10)
         )
 
-        client = APIClient()
-        client.force_authenticate(user=admin_user)
-
         # Filter to last 7 days
         start_date = (now - timedelta(days=7)).isoformat()
-        response = client.get(
+        response = admin_client.get(
             f"/api/v1/polls/{poll.id}/export-audit-trail/?export_format=json&start_date={start_date}"
         )
 
@@ -494,7 +483,7 @@ class TestLargeExportsBackgroundTask:
 
     @patch("apps.polls.tasks.export_poll_data_task.delay")
     def test_large_exports_handled_by_background_task(
-        self, mock_task, user, poll, choices
+        self, mock_task, user, poll, choices, authenticated_client
     ):
         """Test that large exports are handled by background task."""
 
@@ -506,26 +495,32 @@ class TestLargeExportsBackgroundTask:
         user.email = "test@example.com"
         user.save()
 
-        # Create many votes to make export large
-        for i in range(100):
-            vote_user = User.objects.create_user(username=f"user{i}", password="pass")
-            Vote.objects.create(
-                user=vote_user,
-                poll=poll,
-                option=choices[0],
-                voter_token=f"token{i}",
-                idempotency_key=f"key{i}",
-                is_valid=True,
-            )
-
-        client = APIClient()
-        client.force_authenticate(user=user)
+        # Create many votes to make export large. The voters never log in,
+        # so they are inserted with an unusable password and no hashing.
+        voters = User.objects.bulk_create(
+            [User(username=f"voter{i}", password="!") for i in range(100)],
+            batch_size=100,
+        )
+        Vote.objects.bulk_create(
+            [
+                Vote(
+                    user=voter,
+                    poll=poll,
+                    option=choices[0],
+                    voter_token=f"token{i}",
+                    idempotency_key=f"key{i}",
+                    is_valid=True,
+                )
+                for i, voter in enumerate(voters)
+            ],
+            batch_size=100,
+        )
 
         # Mock task
         mock_task.return_value = MagicMock(id="task-123")
 
         # Request with background flag
-        response = client.get(
+        response = authenticated_client.get(
             f"/api/v1/polls/{poll.id}/export-vote-log/?export_format=csv&background=true"
         )
 
@@ -535,7 +530,9 @@ class TestLargeExportsBackgroundTask:
         assert "background" in response.data["message"].lower()
         mock_task.assert_called_once()
 
-    def test_background_export_requires_email(self, user, poll, choices):
+    def test_background_export_requires_email(
+        self, user, poll, choices, authenticated_client
+    ):
         """Test that background exports require email address."""
         # Make user poll owner but no email
         poll.created_by = user
@@ -543,9 +540,6 @@ class TestLargeExportsBackgroundTask:
         user.email = ""
         user.save()
 
-        client = APIClient()
-        client.force_authenticate(user=user)
-
         # Create at least one vote so the endpoint doesn't fail for other reasons
 
         user1 = User.objects.create_user(
@@ -560,7 +554,7 @@ class TestLargeExportsBackgroundTask:
             is_valid=True,
         )
 
-        response = client.get(
+        response = authenticated_client.get(
             f"/api/v1/polls/{poll.id}/export-vote-log/?export_format=csv&background=true"
         )
 
@@ -588,49 +582,41 @@ class TestExportPermissions:
         response = client.get(f"/api/v1/polls/{poll.id}/export-analytics/")
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
-    def test_poll_owner_can_export(self, user, poll, choices):
+    def test_poll_owner_can_export(self, user, poll, authenticated_client):
         """Test that poll owner can export."""
         # Make user poll owner
         poll.created_by = user
         poll.save()
 
-        client = APIClient()
-        client.force_authenticate(user=user)
-
         # Export vote log
-        response = client.get(
+        response = authenticated_client.get(
             f"/api/v1/polls/{poll.id}/export-vote-log/?export_format=json"
         )
         assert response.status_code == status.HTTP_200_OK
 
         # Export analytics
         try:
-            response = client.get(f"/api/v1/polls/{poll.id}/export-analytics/")
+            response = authenticated_client.get(
+                f"/api/v1/polls/{poll.id}/export-analytics/"
+            )
             if response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE:
                 pytest.skip("reportlab not installed")
             assert response.status_code == status.HTTP_200_OK
         except ImportError:
             pytest.skip("reportlab not installed")
 
-    def test_admin_can_export_any_poll(self, user, poll, choices):
+    def test_admin_can_export_any_poll(self, poll, admin_client):
         """Test that admin can export any poll."""
-        # Create admin user
-        admin_user = User.objects.create_user(
-            username="admin", password="pass", is_staff=True, is_superuser=True
-        )
-
-        client = APIClient()
-        client.force_authenticate(user=admin_user)
 
         # Export vote log
-        response = client.get(
+        response = admin_client.get(
             f"/api/v1/polls/{poll.id}/export-vote-log/?export_format=json"
         )
         assert response.status_code == status.HTTP_200_OK
 
         # Export analytics
         try:
-            response = client.get(f"/api/v1/polls/{poll.id}/export-analytics/")
+            response = admin_client.get(f"/api/v1/polls/{poll.id}/export-analytics/")
             if response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE:
                 pytest.skip("reportlab not installed")
             assert response.status_code == status.HTTP_200_OK
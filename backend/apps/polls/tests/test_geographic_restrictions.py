@@ -2,152 +2,165 @@
 Tests for geographic restrictions in voting.
 """
 
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 import pytest
 from apps.polls.models import Poll, PollOption
 from apps.votes.models import VoteAttempt
 from apps.votes.services import cast_vote
 from core.exceptions import InvalidVoteError
-from django.contrib.auth.models import User
+from core.utils.geolocation import validate_geographic_restriction
 from django.test import RequestFactory
 
+# A valid 64-character SHA256 hex fingerprint
+FINGERPRINT = "a" * 64
 
-@pytest.fixture
-def user(db):
-    """Create a test user."""
-    return User.objects.create_user(username="testuser", password="testpass123")
+# A blocked attempt records the validator's message, or a generic geographic
+# restriction message when the validator gives none
+GEO_BLOCK_FRAGMENTS = ("not allowed", "geographic")
 
 
-@pytest.fixture
-def poll_with_geographic_restrictions(db, user):
+# The voter and the restricted polls are only read, so they are shared by the
+# module; the polls go with the user at teardown
+@pytest.fixture(scope="module")
+def user(module_user):
+    """Return the poll owner, who is also the voter."""
+    return module_user
+
+
+@pytest.fixture(scope="module")
+def poll_with_geographic_restrictions(django_db_blocker, user):
     """Create a poll with geographic restrictions."""
-    poll = Poll.objects.create(
-        title="Geographic Restricted Poll",
-        description="Test poll with geographic restrictions",
-        created_by=user,
-        is_active=True,
-        security_rules={
-            "allowed_countries": ["US", "CA", "GB"],
-            "blocked_countries": ["CN", "RU"],
-        },
-    )
-    option1 = PollOption.objects.create(poll=poll, text="Option 1", order=0)
-    option2 = PollOption.objects.create(poll=poll, text="Option 2", order=1)
-    return poll, [option1, option2]
+    with django_db_blocker.unblock():
+        poll = Poll.objects.create(
+            title="Geographic Restricted Poll",
+            description="Test poll with geographic restrictions",
+            created_by=user,
+            is_active=True,
+            security_rules={
+                "allowed_countries": ["US", "CA", "GB"],
+                "blocked_countries": ["CN", "RU"],
+            },
+        )
+        options = PollOption.objects.bulk_create(
+            PollOption(poll=poll, text=f"Option {i + 1}", order=i) for i in range(2)
+        )
+    return poll, options
 
 
-@pytest.fixture
-def poll_with_region_restrictions(db, user):
+@pytest.fixture(scope="module")
+def poll_with_region_restrictions(django_db_blocker, user):
     """Create a poll with region restrictions."""
-    poll = Poll.objects.create(
-        title="Region Restricted Poll",
-        description="Test poll with region restrictions",
-        created_by=user,
-        is_active=True,
-        security_rules={
-            "allowed_regions": ["CA", "NY"],
-            "blocked_regions": ["TX"],
-        },
-    )
-    option1 = PollOption.objects.create(poll=poll, text="Option 1", order=0)
+    with django_db_blocker.unblock():
+        poll = Poll.objects.create(
+            title="Region Restricted Poll",
+            description="Test poll with region restrictions",
+            created_by=user,
+            is_active=True,
+            security_rules={
+                "allowed_regions": ["CA", "NY"],
+                "blocked_regions": ["TX"],
+            },
+        )
+        option1 = PollOption.objects.create(poll=poll, text="Option 1", order=0)
     return poll, [option1]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def request_factory():
-    """Create a request factory."""
+    """Create a request factory, shared by the session (it holds no state)."""
     return RequestFactory()
 
 
+@pytest.fixture
+def geo_request(request_factory):
+    """Build a vote request from a public IP with a valid fingerprint."""
+    request = request_factory.post("/api/v1/votes/cast/")
+    request.META["REMOTE_ADDR"] = "8.8.8.8"
+    request.fingerprint = FINGERPRINT
+    return request
+
+
+@pytest.fixture
+def geo_mocks(request, monkeypatch):
+    """Replace the IP lookups with mocks, returned as ``(country, region)``.
+
+    Parametrize indirectly with a ``(country, region)`` pair to set what the
+    lookups return; both return None otherwise.
+    """
+    country, region = getattr(request, "param", (None, None))
+    get_country = MagicMock(return_value=country)
+    get_region = MagicMock(return_value=region)
+    monkeypatch.setattr("core.utils.geolocation.get_country_from_ip", get_country)
+    monkeypatch.setattr("core.utils.geolocation.get_region_from_ip", get_region)
+    return get_country, get_region
+
+
+def _assert_restriction(is_allowed, error_message, error_fragment):
+    """Check a validator result; ``error_fragment`` is None when it should pass."""
+    if error_fragment is None:
+        assert is_allowed is True
+        assert error_message is None
+    else:
+        assert is_allowed is False
+        assert error_fragment in error_message.lower()
+
+
+@pytest.mark.django_db
 class TestGeographicRestrictions:
-    """Test geographic restrictions in voting."""
+    """Test geographic restrictions in voting.
+
+    cast_vote is exercised end to end for the allowed, blocked, unrestricted
+    and fail-open paths; every country and region rule is also checked
+    against validate_geographic_restriction directly, with the poll's rules.
+    """
 
-    @patch("core.utils.geolocation.get_country_from_ip")
+    @pytest.mark.parametrize("geo_mocks", [("US", None)], indirect=True)
     def test_vote_allowed_from_allowed_country(
-        self, mock_get_country, poll_with_geographic_restrictions, user, request_factory
+        self, geo_mocks, poll_with_geographic_restrictions, user, geo_request
     ):
         """Test that voting is allowed from an allowed country."""
         poll, options = poll_with_geographic_restrictions
-        mock_get_country.return_value = "US"
-
-        request = request_factory.post("/api/v1/votes/cast/")
-        request.META["REMOTE_ADDR"] = "8.8.8.8"
-        request.fingerprint = "a" * 64  # Valid 64-character SHA256 hex fingerprint
 
         vote, is_new = cast_vote(
             user=user,
             poll_id=poll.id,
             choice_id=options[0].id,
-            request=request,
+            request=geo_request,
         )
 
         assert is_new is True
         assert vote.poll == poll
         assert vote.option == options[0]
 
-    @patch("core.utils.geolocation.get_country_from_ip")
+    @pytest.mark.parametrize("geo_mocks", [("CN", None)], indirect=True)
     def test_vote_blocked_from_blocked_country(
-        self, mock_get_country, poll_with_geographic_restrictions, user, request_factory
+        self, geo_mocks, poll_with_geographic_restrictions, user, geo_request
     ):
         """Test that voting is blocked from a blocked country."""
         poll, options = poll_with_geographic_restrictions
-        mock_get_country.return_value = "CN"
 
-        request = request_factory.post("/api/v1/votes/cast/")
-        request.META["REMOTE_ADDR"] = "8.8.8.8"
-        request.fingerprint = "a" * 64  # Valid 64-character SHA256 hex fingerprint
-
-        with pytest.raises(InvalidVoteError) as exc_info:
+        with pytest.raises(InvalidVoteError, match="not allowed from CN"):
             cast_vote(
                 user=user,
                 poll_id=poll.id,
                 choice_id=options[0].id,
-                request=request,
+                request=geo_request,
             )
 
-        assert "not allowed from" in str(exc_info.value).lower() or "CN" in str(
-            exc_info.value
-        )
-
         # Check that VoteAttempt was created
-        attempt = VoteAttempt.objects.filter(poll=poll, success=False).first()
-        assert attempt is not None
-        assert (
-            "geographic" in attempt.error_message.lower()
-            or "not allowed" in attempt.error_message.lower()
-        )
-
-    @patch("core.utils.geolocation.get_country_from_ip")
-    def test_vote_blocked_from_not_allowed_country(
-        self, mock_get_country, poll_with_geographic_restrictions, user, request_factory
-    ):
-        """Test that voting is blocked from a country not in allowed list."""
-        poll, options = poll_with_geographic_restrictions
-        mock_get_country.return_value = "FR"
-
-        request = request_factory.post("/api/v1/votes/cast/")
-        request.META["REMOTE_ADDR"] = "8.8.8.8"
-        request.fingerprint = "a" * 64  # Valid 64-character SHA256 hex fingerprint
-
-        with pytest.raises(InvalidVoteError) as exc_info:
-            cast_vote(
-                user=user,
-                poll_id=poll.id,
-                choice_id=options[0].id,
-                request=request,
-            )
-
-        assert (
-            "only allowed from" in str(exc_info.value).lower()
-            or "not allowed" in str(exc_info.value).lower()
+        error_message = (
+            VoteAttempt.objects.filter(poll=poll, success=False)
+            .values_list("error_message", flat=True)
+            .first()
         )
+        assert error_message is not None
+        error_message = error_message.lower()
+        assert any(fragment in error_message for fragment in GEO_BLOCK_FRAGMENTS)
 
-    @patch("core.utils.geolocation.get_country_from_ip")
-    def test_vote_allowed_when_no_restrictions(
-        self, mock_get_country, db, user, request_factory
-    ):
+    def test_vote_allowed_when_no_restrictions(self, geo_mocks, db, user, geo_request):
         """Test that voting is allowed when no geographic restrictions are set."""
+        mock_get_country, _ = geo_mocks
         poll = Poll.objects.create(
             title="No Restrictions Poll",
             description="Test poll without restrictions",
@@ -157,158 +170,77 @@ class TestGeographicRestrictions:
         )
         option = PollOption.objects.create(poll=poll, text="Option 1", order=0)
 
-        request = request_factory.post("/api/v1/votes/cast/")
-        request.META["REMOTE_ADDR"] = "8.8.8.8"
-        request.fingerprint = "a" * 64  # Valid 64-character SHA256 hex fingerprint
-
         vote, is_new = cast_vote(
             user=user,
             poll_id=poll.id,
             choice_id=option.id,
-            request=request,
+            request=geo_request,
         )
 
         assert is_new is True
         # Should not have called geolocation
         mock_get_country.assert_not_called()
 
-    @patch("core.utils.geolocation.get_country_from_ip")
-    def test_vote_allowed_from_private_ip(
-        self, mock_get_country, poll_with_geographic_restrictions, user, request_factory
-    ):
-        """Test that voting from private IP is allowed (geolocation returns None)."""
-        poll, options = poll_with_geographic_restrictions
-        mock_get_country.return_value = None  # Private IPs return None
-
-        request = request_factory.post("/api/v1/votes/cast/")
-        request.META["REMOTE_ADDR"] = "192.168.1.1"  # Private IP
-        request.fingerprint = "a" * 64  # Valid 64-character SHA256 hex fingerprint
-
-        # Should fail because we can't determine country and restrictions are set
-        with pytest.raises(InvalidVoteError) as exc_info:
-            cast_vote(
-                user=user,
-                poll_id=poll.id,
-                choice_id=options[0].id,
-                request=request,
-            )
-
-        assert (
-            "could not determine" in str(exc_info.value).lower()
-            or "not allowed" in str(exc_info.value).lower()
-        )
-
-    @patch("core.utils.geolocation.get_country_from_ip")
-    @patch("core.utils.geolocation.get_region_from_ip")
-    def test_vote_allowed_from_allowed_region(
-        self,
-        mock_get_region,
-        mock_get_country,
-        poll_with_region_restrictions,
-        user,
-        request_factory,
+    @pytest.mark.parametrize(
+        "geo_mocks,ip_address,error_fragment",
+        [
+            (("US", None), "8.8.8.8", None),
+            (("CN", None), "8.8.8.8", "not allowed from cn"),
+            (("FR", None), "8.8.8.8", "only allowed from"),
+            # Private IPs resolve to no country, which fails closed
+            ((None, None), "192.168.1.1", "could not determine"),
+        ],
+        indirect=["geo_mocks"],
+    )
+    def test_country_restriction(
+        self, geo_mocks, ip_address, error_fragment, poll_with_geographic_restrictions
     ):
-        """Test that voting is allowed from an allowed region."""
-        poll, options = poll_with_region_restrictions
-        mock_get_country.return_value = "US"
-        mock_get_region.return_value = "CA"
+        """Test the allowed and blocked country rules."""
+        poll, _ = poll_with_geographic_restrictions
 
-        request = request_factory.post("/api/v1/votes/cast/")
-        request.META["REMOTE_ADDR"] = "8.8.8.8"
-        request.fingerprint = "a" * 64  # Valid 64-character SHA256 hex fingerprint
-
-        vote, is_new = cast_vote(
-            user=user,
-            poll_id=poll.id,
-            choice_id=options[0].id,
-            request=request,
+        is_allowed, error_message = validate_geographic_restriction(
+            ip_address, **poll.security_rules
         )
 
-        assert is_new is True
-        assert vote.poll == poll
+        _assert_restriction(is_allowed, error_message, error_fragment)
 
-    @patch("core.utils.geolocation.get_country_from_ip")
-    @patch("core.utils.geolocation.get_region_from_ip")
-    def test_vote_blocked_from_blocked_region(
-        self,
-        mock_get_region,
-        mock_get_country,
-        poll_with_region_restrictions,
-        user,
-        request_factory,
+    @pytest.mark.parametrize(
+        "geo_mocks,error_fragment",
+        [
+            (("US", "CA"), None),
+            (("US", "TX"), "not allowed from region"),
+            (("US", "FL"), "only allowed from regions"),
+        ],
+        indirect=["geo_mocks"],
+    )
+    def test_region_restriction(
+        self, geo_mocks, error_fragment, poll_with_region_restrictions
     ):
-        """Test that voting is blocked from a blocked region."""
-        poll, options = poll_with_region_restrictions
-        mock_get_country.return_value = "US"
-        mock_get_region.return_value = "TX"
-
-        request = request_factory.post("/api/v1/votes/cast/")
-        request.META["REMOTE_ADDR"] = "8.8.8.8"
-        request.fingerprint = "a" * 64  # Valid 64-character SHA256 hex fingerprint
-
-        with pytest.raises(InvalidVoteError) as exc_info:
-            cast_vote(
-                user=user,
-                poll_id=poll.id,
-                choice_id=options[0].id,
-                request=request,
-            )
+        """Test the allowed and blocked region rules."""
+        poll, _ = poll_with_region_restrictions
 
-        assert (
-            "not allowed from region" in str(exc_info.value).lower()
-            or "not allowed" in str(exc_info.value).lower()
+        is_allowed, error_message = validate_geographic_restriction(
+            "8.8.8.8", **poll.security_rules
         )
 
-    @patch("core.utils.geolocation.get_country_from_ip")
-    @patch("core.utils.geolocation.get_region_from_ip")
-    def test_vote_blocked_from_not_allowed_region(
-        self,
-        mock_get_region,
-        mock_get_country,
-        poll_with_region_restrictions,
-        user,
-        request_factory,
-    ):
-        """Test that voting is blocked from a region not in allowed list."""
-        poll, options = poll_with_region_restrictions
-        mock_get_country.return_value = "US"
-        mock_get_region.return_value = "FL"
-
-        request = request_factory.post("/api/v1/votes/cast/")
-        request.META["REMOTE_ADDR"] = "8.8.8.8"
-        request.fingerprint = "a" * 64  # Valid 64-character SHA256 hex fingerprint
+        _assert_restriction(is_allowed, error_message, error_fragment)
 
-        with pytest.raises(InvalidVoteError) as exc_info:
-            cast_vote(
-                user=user,
-                poll_id=poll.id,
-                choice_id=options[0].id,
-                request=request,
-            )
-
-        assert (
-            "only allowed from regions" in str(exc_info.value).lower()
-            or "not allowed" in str(exc_info.value).lower()
-        )
-
-    @patch("core.utils.geolocation.validate_geographic_restriction")
     def test_geographic_restriction_error_handling(
-        self, mock_validate, poll_with_geographic_restrictions, user, request_factory
+        self, monkeypatch, poll_with_geographic_restrictions, user, geo_request
     ):
         """Test that geolocation errors don't block votes (fail open)."""
         poll, options = poll_with_geographic_restrictions
-        mock_validate.side_effect = Exception("Geolocation service error")
-
-        request = request_factory.post("/api/v1/votes/cast/")
-        request.META["REMOTE_ADDR"] = "8.8.8.8"
-        request.fingerprint = "a" * 64  # Valid 64-character SHA256 hex fingerprint
+        monkeypatch.setattr(
+            "core.utils.geolocation.validate_geographic_restriction",
+            MagicMock(side_effect=Exception("Geolocation service error")),
+        )
 
         # Should allow vote despite geolocation error (fail open)
         vote, is_new = cast_vote(
             user=user,
             poll_id=poll.id,
             choice_id=options[0].id,
-            request=request,
+            request=geo_request,
         )
 
         assert is_new is True
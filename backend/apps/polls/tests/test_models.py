@@ -6,15 +6,30 @@ from datetime import timedelta
 
 import pytest
 from apps.polls.models import Poll, PollOption
+from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
-from django.db import transaction
+from django.db import connection
 from django.utils import timezone
 
 
+def _index_columns(table_name):
+    """Return the column lists of the indexes on ``table_name``."""
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, table_name)
+    return [c["columns"] for c in constraints.values() if c["index"]]
+
+
+@pytest.fixture(scope="module")
+def user(module_user):
+    """Return the owner of the polls under test, shared by the module."""
+    return module_user
+
+
 @pytest.mark.unit
 class TestPollModel:
     """Test Poll model creation and properties."""
 
+    @pytest.mark.django_db
     def test_poll_creation(self, user):
         """Test creating a poll with all fields."""
         poll = Poll.objects.create(
@@ -38,6 +53,7 @@ class TestPollModel:
         assert poll.created_at is not None
         assert poll.updated_at is not None
 
+    @pytest.mark.django_db
     def test_poll_default_values(self, user):
         """Test poll default values."""
         poll = Poll.objects.create(title="Test Poll", created_by=user)
@@ -47,76 +63,83 @@ class TestPollModel:
         assert poll.cached_unique_voters == 0
         assert poll.is_active is True
 
-    def test_poll_is_open_property(self, poll):
+    # is_open only reads instance attributes, so these checks use unsaved polls
+    def test_poll_is_open_property(self):
         """Test poll is_open property when poll is open."""
+        poll = Poll(title="Test Poll")
         poll.starts_at = timezone.now() - timedelta(days=1)
         poll.ends_at = None
         poll.is_active = True
-        poll.save()
         assert poll.is_open is True
 
-    def test_poll_is_closed_when_inactive(self, poll):
+    def test_poll_is_closed_when_inactive(self):
         """Test poll is closed when inactive."""
+        poll = Poll(title="Test Poll")
         poll.is_active = False
-        poll.save()
         assert poll.is_open is False
 
-    def test_poll_is_closed_when_ended(self, poll):
+    def test_poll_is_closed_when_ended(self):
         """Test poll is closed when end date passed."""
-        poll.starts_at = timezone.now() - timedelta(days=2)
-        poll.ends_at = timezone.now() - timedelta(days=1)
+        poll = Poll(title="Test Poll")
+        now = timezone.now()
+        poll.starts_at = now - timedelta(days=2)
+        poll.ends_at = now - timedelta(days=1)
         poll.is_active = True
-        poll.save()
         assert poll.is_open is False
 
-    def test_poll_is_closed_when_not_started(self, poll):
+    def test_poll_is_closed_when_not_started(self):
         """Test poll is closed when start date hasn't arrived."""
+        poll = Poll(title="Test Poll")
         poll.starts_at = timezone.now() + timedelta(days=1)
         poll.ends_at = None
         poll.is_active = True
-        poll.save()
         assert poll.is_open is False
 
+    @pytest.mark.django_db
     def test_poll_update_cached_totals(self, poll, user):
         """Test updating cached totals."""
         import time
 
         from apps.votes.models import Vote
-        from django.contrib.auth.models import User
 
         # Create some votes from different users (same user can't vote twice on same poll)
-        option1 = PollOption.objects.create(poll=poll, text="Option 1")
-        option2 = PollOption.objects.create(poll=poll, text="Option 2")
+        option1, option2 = PollOption.objects.bulk_create(
+            PollOption(poll=poll, text=f"Option {i}") for i in (1, 2)
+        )
 
         timestamp = int(time.time() * 1000000)
         user2 = User.objects.create_user(username=f"user2_{timestamp}", password="pass")
 
-        Vote.objects.create(
-            user=user,
-            poll=poll,
-            option=option1,
-            voter_token="token1",
-            idempotency_key="key1",
-        )
-        Vote.objects.create(
-            user=user2,
-            poll=poll,
-            option=option2,
-            voter_token="token2",
-            idempotency_key="key2",
+        # Vote has no save signals, so one bulk INSERT leaves the cached
+        # totals untouched until update_cached_totals runs
+        Vote.objects.bulk_create(
+            [
+                Vote(
+                    user=voter,
+                    poll=poll,
+                    option=option,
+                    voter_token=f"token{i}",
+                    idempotency_key=f"key{i}",
+                )
+                for i, (voter, option) in enumerate(
+                    ((user, option1), (user2, option2)), start=1
+                )
+            ]
         )
 
+        # update_cached_totals sets the totals on the instance it saves
         poll.update_cached_totals()
-        poll.refresh_from_db()
         assert poll.cached_total_votes == 2
         assert poll.cached_unique_voters == 2  # Two different users
 
+    @pytest.mark.django_db
     def test_poll_str_representation(self, poll):
         """Test poll string representation."""
         assert str(poll) == poll.title
 
 
 @pytest.mark.unit
+@pytest.mark.django_db
 class TestPollOptionModel:
     """Test PollOption model creation and properties."""
 
@@ -170,15 +193,16 @@ class TestPollOptionModel:
             idempotency_key="key1",
         )
         option.update_cached_vote_count()
-        option.refresh_from_db()
         assert option.cached_vote_count == 1
 
     def test_poll_option_ordering(self, poll):
         """Test poll option ordering by order field."""
-        option1 = PollOption.objects.create(poll=poll, text="Option 1", order=2)
-        option2 = PollOption.objects.create(poll=poll, text="Option 2", order=1)
-        option3 = PollOption.objects.create(poll=poll, text="Option 3", order=3)
+        option1, option2, option3 = PollOption.objects.bulk_create(
+            PollOption(poll=poll, text=f"Option {i}", order=order)
+            for i, order in ((1, 2), (2, 1), (3, 3))
+        )
 
+        # No order_by: the model's default ordering is what is under test
         options = list(PollOption.objects.filter(poll=poll))
         assert options[0] == option2  # order=1
         assert options[1] == option1  # order=2
@@ -214,17 +238,9 @@ class TestPollModelDatabaseConstraints:
         with pytest.raises(Exception):
             Poll.objects.create(title="Test Poll")
 
-    @pytest.mark.skip(
-        reason="get_indexes method not available in Django 5.x - use database-specific introspection"
-    )
-    def test_poll_indexes_exist(self, poll):
+    def test_poll_indexes_exist(self):
         """Test that poll indexes exist."""
-        from django.db import connection
-
-        indexes = connection.introspection.get_indexes(
-            connection.cursor(), "polls_poll"
-        )
-        index_fields = [idx["columns"] for idx in indexes.values()]
+        index_fields = _index_columns(Poll._meta.db_table)
 
         # Check for created_at index
         assert any("created_at" in fields for fields in index_fields)
@@ -255,18 +271,9 @@ class TestPollOptionModelDatabaseConstraints:
         with pytest.raises(ValidationError):
             option.full_clean()
 
-    @pytest.mark.skip(
-        reason="get_indexes method not available in Django 5.x - use database-specific introspection"
-    )
-    def test_poll_option_indexes_exist(self, poll):
+    def test_poll_option_indexes_exist(self):
         """Test that poll option indexes exist."""
-        from django.db import connection
-
-        PollOption.objects.create(poll=poll, text="Option 1", order=1)
-        indexes = connection.introspection.get_indexes(
-            connection.cursor(), "polls_polloption"
-        )
-        index_fields = [idx["columns"] for idx in indexes.values()]
+        index_fields = _index_columns(PollOption._meta.db_table)
 
         # Check for poll, order index
         assert any("poll_id" in fields and "order" in fields for fields in index_fields)
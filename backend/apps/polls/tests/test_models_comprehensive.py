@@ -12,10 +12,32 @@ from apps.polls.factories import (
     PollOptionFactory,
     TagFactory,
 )
-from apps.polls.models import Category, PollOption, Tag
+from apps.polls.models import Category, Poll, PollOption, Tag
+from apps.users.factories import UserFactory
+from apps.votes.factories import VoteFactory
+from apps.votes.models import Vote
+from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from django.utils import timezone
+from django.utils.text import slugify
+
+
+def _indexed_fields(model):
+    """Return the field lists of the indexes declared in ``model``'s Meta."""
+    return [list(index.fields) for index in model._meta.indexes]
+
+
+def _create_votes(poll, option, count):
+    """Create ``count`` votes for ``option``, each from a new user.
+
+    Users and votes are built in memory and inserted with one ``bulk_create``
+    per table; the users get no password hash.
+    """
+    users = User.objects.bulk_create(UserFactory.build_batch(count))
+    return Vote.objects.bulk_create(
+        VoteFactory.build(user=voter, poll=poll, option=option) for voter in users
+    )
 
 
 @pytest.mark.unit
@@ -33,7 +55,8 @@ class TestCategoryModel:
 
     def test_category_auto_slug_generation(self):
         """Test that slug is auto-generated from name."""
-        category = CategoryFactory(name="Sports & Entertainment")
+        # An empty slug leaves it to Category.save, not the factory
+        category = CategoryFactory(name="Sports & Entertainment", slug="")
         assert category.slug == "sports-entertainment"
 
     def test_category_unique_name(self):
@@ -41,17 +64,22 @@ class TestCategoryModel:
         from apps.polls.models import Category
 
         Category.objects.create(name="Unique Category", slug="unique-category")
-        with pytest.raises(IntegrityError):
+        with pytest.raises(IntegrityError), transaction.atomic():
             Category.objects.create(name="Unique Category", slug="unique-category-2")
 
+        # Only the savepoint was rolled back; the test transaction is still usable
+        assert Category.objects.filter(name="Unique Category").count() == 1
+
     def test_category_unique_slug(self):
         """Test that category slug must be unique."""
         from apps.polls.models import Category
 
         Category.objects.create(name="Test Category", slug="test-category")
-        with pytest.raises(IntegrityError):
+        with pytest.raises(IntegrityError), transaction.atomic():
             Category.objects.create(name="Different Name", slug="test-category")
 
+        assert Category.objects.filter(slug="test-category").count() == 1
+
     def test_category_str_representation(self):
         """Test category string representation."""
         category = CategoryFactory(name="Test Category")
@@ -59,33 +87,22 @@ class TestCategoryModel:
 
     def test_category_ordering(self):
         """Test that categories are ordered by name."""
-        CategoryFactory(name="Zebra")
-        CategoryFactory(name="Alpha")
-        CategoryFactory(name="Beta")
+        Category.objects.bulk_create(
+            Category(name=name, slug=slugify(name))
+            for name in ("Zebra", "Alpha", "Beta")
+        )
 
-        categories = list(Category.objects.all())
-        assert categories[0].name == "Alpha"
-        assert categories[1].name == "Beta"
-        assert categories[2].name == "Zebra"
+        names = Category.objects.values_list("name", flat=True)
+        assert list(names) == ["Alpha", "Beta", "Zebra"]
 
     def test_category_with_empty_description(self):
         """Test category can have empty description."""
         category = CategoryFactory(description="")
         assert category.description == ""
 
-    @pytest.mark.skip(
-        reason="get_indexes method not available in Django 5.x - use database-specific introspection"
-    )
     def test_category_slug_index(self):
         """Test that slug has an index for efficient lookups."""
-        from django.db import connection
-
-        category = CategoryFactory()
-        indexes = connection.introspection.get_indexes(
-            connection.cursor(), "polls_category"
-        )
-        index_fields = [idx["columns"] for idx in indexes.values()]
-        assert any("slug" in fields for fields in index_fields)
+        assert ["slug"] in _indexed_fields(Category)
 
 
 @pytest.mark.unit
@@ -102,7 +119,7 @@ class TestTagModel:
 
     def test_tag_auto_slug_generation(self):
         """Test that slug is auto-generated from name."""
-        tag = TagFactory(name="Machine Learning")
+        tag = TagFactory(name="Machine Learning", slug="")
         assert tag.slug == "machine-learning"
 
     def test_tag_unique_name(self):
@@ -110,17 +127,21 @@ class TestTagModel:
         from apps.polls.models import Tag
 
         Tag.objects.create(name="unique-tag", slug="unique-tag")
-        with pytest.raises(IntegrityError):
+        with pytest.raises(IntegrityError), transaction.atomic():
             Tag.objects.create(name="unique-tag", slug="unique-tag-2")
 
+        assert Tag.objects.filter(name="unique-tag").count() == 1
+
     def test_tag_unique_slug(self):
         """Test that tag slug must be unique."""
         from apps.polls.models import Tag
 
         Tag.objects.create(name="Test Tag", slug="test-tag")
-        with pytest.raises(IntegrityError):
+        with pytest.raises(IntegrityError), transaction.atomic():
             Tag.objects.create(name="Different Tag", slug="test-tag")
 
+        assert Tag.objects.filter(slug="test-tag").count() == 1
+
     def test_tag_str_representation(self):
         """Test tag string representation."""
         tag = TagFactory(name="test-tag")
@@ -128,38 +149,20 @@ class TestTagModel:
 
     def test_tag_ordering(self):
         """Test that tags are ordered by name."""
-        TagFactory(name="zebra")
-        TagFactory(name="alpha")
-        TagFactory(name="beta")
+        Tag.objects.bulk_create(
+            Tag(name=name, slug=slugify(name)) for name in ("zebra", "alpha", "beta")
+        )
 
-        tags = list(Tag.objects.all())
-        assert tags[0].name == "alpha"
-        assert tags[1].name == "beta"
-        assert tags[2].name == "zebra"
+        names = Tag.objects.values_list("name", flat=True)
+        assert list(names) == ["alpha", "beta", "zebra"]
 
-    @pytest.mark.skip(
-        reason="get_indexes method not available in Django 5.x - use database-specific introspection"
-    )
     def test_tag_slug_index(self):
         """Test that slug has an index."""
-        from django.db import connection
-
-        tag = TagFactory()
-        indexes = connection.introspection.get_indexes(connection.cursor(), "polls_tag")
-        index_fields = [idx["columns"] for idx in indexes.values()]
-        assert any("slug" in fields for fields in index_fields)
+        assert ["slug"] in _indexed_fields(Tag)
 
-    @pytest.mark.skip(
-        reason="get_indexes method not available in Django 5.x - use database-specific introspection"
-    )
     def test_tag_name_index(self):
         """Test that name has an index."""
-        from django.db import connection
-
-        tag = TagFactory()
-        indexes = connection.introspection.get_indexes(connection.cursor(), "polls_tag")
-        index_fields = [idx["columns"] for idx in indexes.values()]
-        assert any("name" in fields for fields in index_fields)
+        assert ["name"] in _indexed_fields(Tag)
 
 
 @pytest.mark.unit
@@ -172,7 +175,7 @@ class TestPollModelComprehensive:
         category = CategoryFactory()
         poll = PollFactory(created_by=user, category=category)
         assert poll.category == category
-        assert poll in category.polls.all()
+        assert category.polls.filter(pk=poll.pk).exists()
 
     def test_poll_with_tags(self, user):
         """Test poll with multiple tags."""
@@ -181,8 +184,8 @@ class TestPollModelComprehensive:
         poll = PollFactory(created_by=user, tags=[tag1, tag2])
         assert tag1 in poll.tags.all()
         assert tag2 in poll.tags.all()
-        assert poll in tag1.polls.all()
-        assert poll in tag2.polls.all()
+        assert tag1.polls.filter(pk=poll.pk).exists()
+        assert tag2.polls.filter(pk=poll.pk).exists()
 
     def test_poll_draft_not_open(self, user):
         """Test that draft polls are never open."""
@@ -190,11 +193,11 @@ class TestPollModelComprehensive:
         assert poll.is_open is False
 
     def test_poll_is_open_edge_cases(self, user):
-        """Test is_open property with various edge cases."""
+        """Test is_open property with various edge cases, on unsaved polls."""
         now = timezone.now()
 
         # Poll that hasn't started
-        poll = PollFactory(
+        poll = PollFactory.build(
             created_by=user,
             starts_at=now + timedelta(days=1),
             is_active=True,
@@ -203,7 +206,7 @@ class TestPollModelComprehensive:
         assert poll.is_open is False
 
         # Poll that has ended
-        poll = PollFactory(
+        poll = PollFactory.build(
             created_by=user,
             starts_at=now - timedelta(days=2),
             ends_at=now - timedelta(days=1),
@@ -213,7 +216,7 @@ class TestPollModelComprehensive:
         assert poll.is_open is False
 
         # Poll currently open
-        poll = PollFactory(
+        poll = PollFactory.build(
             created_by=user,
             starts_at=now - timedelta(days=1),
             ends_at=None,
@@ -223,7 +226,7 @@ class TestPollModelComprehensive:
         assert poll.is_open is True
 
         # Poll with end date in future
-        poll = PollFactory(
+        poll = PollFactory.build(
             created_by=user,
             starts_at=now - timedelta(days=1),
             ends_at=now + timedelta(days=1),
@@ -234,23 +237,13 @@ class TestPollModelComprehensive:
 
     def test_poll_update_cached_totals_with_multiple_users(self, user):
         """Test updating cached totals with multiple users."""
-        from apps.users.factories import UserFactory
-        from apps.votes.factories import VoteFactory
-
         poll = PollFactory(created_by=user)
         option = PollOptionFactory(poll=poll)
 
         # Create votes from different users
-        user1 = UserFactory()
-        user2 = UserFactory()
-        user3 = UserFactory()
-
-        VoteFactory(user=user1, poll=poll, option=option)
-        VoteFactory(user=user2, poll=poll, option=option)
-        VoteFactory(user=user3, poll=poll, option=option)
+        _create_votes(poll, option, 3)
 
         poll.update_cached_totals()
-        poll.refresh_from_db()
         assert poll.cached_total_votes == 3
         assert poll.cached_unique_voters == 3
 
@@ -258,41 +251,16 @@ class TestPollModelComprehensive:
         """Test updating cached totals for poll with no votes."""
         poll = PollFactory(created_by=user)
         poll.update_cached_totals()
-        poll.refresh_from_db()
         assert poll.cached_total_votes == 0
         assert poll.cached_unique_voters == 0
 
-    @pytest.mark.skip(
-        reason="get_indexes method not available in Django 5.x - use database-specific introspection"
-    )
-    def test_poll_category_index(self, user):
+    def test_poll_category_index(self):
         """Test that category has an index."""
-        from django.db import connection
-
-        poll = PollFactory(created_by=user)
-        indexes = connection.introspection.get_indexes(
-            connection.cursor(), "polls_poll"
-        )
-        index_fields = [idx["columns"] for idx in indexes.values()]
-        assert any("category_id" in fields for fields in index_fields)
+        assert ["category"] in _indexed_fields(Poll)
 
-    @pytest.mark.skip(
-        reason="get_indexes method not available in Django 5.x - use database-specific introspection"
-    )
-    def test_poll_draft_index(self, user):
+    def test_poll_draft_index(self):
         """Test that is_draft and created_by have a composite index."""
-        from django.db import connection
-
-        poll = PollFactory(created_by=user, is_draft=True)
-        indexes = connection.introspection.get_indexes(
-            connection.cursor(), "polls_poll"
-        )
-        index_fields = [idx["columns"] for idx in indexes.values()]
-        # Check for composite index on is_draft and created_by
-        assert any(
-            "is_draft" in fields and "created_by_id" in fields
-            for fields in index_fields
-        )
+        assert ["is_draft", "created_by"] in _indexed_fields(Poll)
 
 
 @pytest.mark.unit
@@ -303,67 +271,45 @@ class TestPollOptionModelComprehensive:
     def test_poll_option_ordering(self, user):
         """Test poll option ordering."""
         poll = PollFactory(created_by=user)
-        option3 = PollOptionFactory(poll=poll, text="Option 3", order=3)
-        option1 = PollOptionFactory(poll=poll, text="Option 1", order=1)
-        option2 = PollOptionFactory(poll=poll, text="Option 2", order=2)
+        # Inserted out of order, so only Meta.ordering can sort them
+        PollOption.objects.bulk_create(
+            PollOption(poll=poll, text=f"Option {order}", order=order)
+            for order in (3, 1, 2)
+        )
 
-        options = list(poll.options.all())
-        assert options[0] == option1
-        assert options[1] == option2
-        assert options[2] == option3
+        texts = poll.options.values_list("text", flat=True)
+        assert list(texts) == ["Option 1", "Option 2", "Option 3"]
 
     def test_poll_option_vote_count_property(self, user):
         """Test vote_count property with multiple votes."""
-        from apps.users.factories import UserFactory
-        from apps.votes.factories import VoteFactory
-
         poll = PollFactory(created_by=user)
         option = PollOptionFactory(poll=poll)
 
         # Create multiple votes
-        for _ in range(5):
-            vote_user = UserFactory()
-            VoteFactory(user=vote_user, poll=poll, option=option)
+        _create_votes(poll, option, 5)
 
         assert option.vote_count == 5
 
     def test_poll_option_update_cached_vote_count(self, user):
         """Test updating cached vote count."""
-        from apps.users.factories import UserFactory
-        from apps.votes.factories import VoteFactory
-
         poll = PollFactory(created_by=user)
         option = PollOptionFactory(poll=poll)
 
         # Create votes
-        for _ in range(3):
-            vote_user = UserFactory()
-            VoteFactory(user=vote_user, poll=poll, option=option)
+        _create_votes(poll, option, 3)
 
         option.update_cached_vote_count()
-        option.refresh_from_db()
         assert option.cached_vote_count == 3
 
     def test_poll_option_cascade_delete(self, user):
         """Test that options are deleted when poll is deleted."""
         poll = PollFactory(created_by=user)
-        option = PollOptionFactory(poll=poll)
-        option_id = option.id
+        PollOptionFactory(poll=poll)
 
-        poll.delete()
-        assert not PollOption.objects.filter(id=option_id).exists()
+        # delete() reports the rows it removed per model, cascades included
+        _, deleted = poll.delete()
+        assert deleted[PollOption._meta.label] == 1
 
-    @pytest.mark.skip(
-        reason="get_indexes method not available in Django 5.x - use database-specific introspection"
-    )
-    def test_poll_option_poll_index(self, user):
+    def test_poll_option_poll_index(self):
         """Test that poll and order have a composite index."""
-        from django.db import connection
-
-        poll = PollFactory(created_by=user)
-        option = PollOptionFactory(poll=poll)
-        indexes = connection.introspection.get_indexes(
-            connection.cursor(), "polls_polloption"
-        )
-        index_fields = [idx["columns"] for idx in indexes.values()]
-        assert any("poll_id" in fields and "order" in fields for fields in index_fields)
+        assert ["poll", "order"] in _indexed_fields(PollOption)
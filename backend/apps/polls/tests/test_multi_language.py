@@ -4,31 +4,67 @@ Tests for multi-language support in polls.
 
 import pytest
 from apps.polls.models import Poll, PollOption
-from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
+# Poll list and detail queries, however many polls and options are returned:
+# the page count (list only), the polls with their owners, the tags prefetch,
+# the options prefetch with vote counts, and the audit log insert. These polls
+# have no category, so the category prefetch is skipped.
+LIST_QUERY_BUDGET = 5
+DETAIL_QUERY_BUDGET = 4
 
-@pytest.fixture
-def user():
-    """Create a test user."""
-    return User.objects.create_user(username="testuser", password="testpass123")
 
+# The user, its clients and the fully translated poll are only read, so they
+# are shared by the module; translated_poll goes with the user at teardown
+@pytest.fixture(scope="module")
+def user(module_user):
+    """Return the poll owner, shared by the module."""
+    return module_user
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def api_client():
-    """Create an API client."""
+    """Create an API client, shared by the module."""
     return APIClient()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def authenticated_client(api_client, user):
-    """Create an authenticated API client."""
+    """Create an authenticated API client, shared by the module."""
     api_client.force_authenticate(user=user)
     return api_client
 
 
+@pytest.fixture(scope="module")
+def translated_poll(django_db_blocker, user):
+    """Create a poll and option translated into every supported language."""
+    with django_db_blocker.unblock():
+        poll = Poll.objects.create(
+            title="Test Poll",
+            title_es="Encuesta de Prueba",
+            title_fr="Sondage de Test",
+            title_de="Test-Umfrage",
+            title_sw="Uchaguzi wa Jaribio",
+            description="English description",
+            description_es="Descripción en español",
+            description_fr="Description en français",
+            created_by=user,
+        )
+        PollOption.objects.create(
+            poll=poll,
+            text="Option 1",
+            text_es="Opción 1",
+            text_fr="Option 1 (FR)",
+            text_de="Option 1 (DE)",
+            text_sw="Chaguo 1",
+        )
+    return poll
+
+
 @pytest.mark.django_db
 class TestMultiLanguagePollCreation:
     """Test creating polls with multiple languages."""
@@ -125,105 +161,62 @@ class TestMultiLanguagePollCreation:
 class TestAPILanguageParameter:
     """Test API language parameter handling."""
 
-    def test_api_returns_english_by_default(self, authenticated_client, user):
+    def test_api_returns_english_by_default(
+        self, authenticated_client, assert_no_nplusone, translated_poll
+    ):
         """Test that API returns English by default when no language specified."""
-        # Create poll with translations
-        poll = Poll.objects.create(
-            title="Test Poll",
-            title_es="Encuesta de Prueba",
-            title_fr="Sondage de Test",
-            created_by=user,
-        )
-        PollOption.objects.create(poll=poll, text="Option 1", text_es="Opción 1")
+        poll = translated_poll
 
         url = reverse("poll-detail", kwargs={"pk": poll.id})
-        response = authenticated_client.get(url)
+        with assert_no_nplusone():
+            response = authenticated_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["title"] == "Test Poll"
         assert response.data["options"][0]["text"] == "Option 1"
 
-    def test_api_returns_spanish_with_lang_parameter(self, authenticated_client, user):
-        """Test that API returns Spanish when lang=es parameter is provided."""
-        # Create poll with translations
-        poll = Poll.objects.create(
-            title="Test Poll",
-            title_es="Encuesta de Prueba",
-            created_by=user,
-        )
-        PollOption.objects.create(poll=poll, text="Option 1", text_es="Opción 1")
-
-        url = reverse("poll-detail", kwargs={"pk": poll.id})
-        response = authenticated_client.get(url, {"lang": "es"})
-
-        assert response.status_code == status.HTTP_200_OK
-        assert response.data["title"] == "Encuesta de Prueba"
-        assert response.data["options"][0]["text"] == "Opción 1"
-
-    def test_api_returns_french_with_lang_parameter(self, authenticated_client, user):
-        """Test that API returns French when lang=fr parameter is provided."""
-        # Create poll with translations
-        poll = Poll.objects.create(
-            title="Test Poll",
-            title_fr="Sondage de Test",
-            created_by=user,
-        )
-        PollOption.objects.create(poll=poll, text="Option 1", text_fr="Option 1 (FR)")
-
-        url = reverse("poll-detail", kwargs={"pk": poll.id})
-        response = authenticated_client.get(url, {"lang": "fr"})
-
-        assert response.status_code == status.HTTP_200_OK
-        assert response.data["title"] == "Sondage de Test"
-        assert response.data["options"][0]["text"] == "Option 1 (FR)"
-
-    def test_api_returns_german_with_lang_parameter(self, authenticated_client, user):
-        """Test that API returns German when lang=de parameter is provided."""
-        # Create poll with translations
-        poll = Poll.objects.create(
-            title="Test Poll",
-            title_de="Test-Umfrage",
-            created_by=user,
-        )
-        PollOption.objects.create(poll=poll, text="Option 1", text_de="Option 1 (DE)")
-
-        url = reverse("poll-detail", kwargs={"pk": poll.id})
-        response = authenticated_client.get(url, {"lang": "de"})
-
-        assert response.status_code == status.HTTP_200_OK
-        assert response.data["title"] == "Test-Umfrage"
-        assert response.data["options"][0]["text"] == "Option 1 (DE)"
-
-    def test_api_returns_swahili_with_lang_parameter(self, authenticated_client, user):
-        """Test that API returns Swahili when lang=sw parameter is provided."""
-        # Create poll with translations
-        poll = Poll.objects.create(
-            title="Test Poll",
-            title_sw="Uchaguzi wa Jaribio",
-            created_by=user,
-        )
-        PollOption.objects.create(poll=poll, text="Option 1", text_sw="Chaguo 1")
+    @pytest.mark.parametrize(
+        "lang,expected_title,expected_option",
+        [
+            ("es", "Encuesta de Prueba", "Opción 1"),
+            ("fr", "Sondage de Test", "Option 1 (FR)"),
+            ("de", "Test-Umfrage", "Option 1 (DE)"),
+            ("sw", "Uchaguzi wa Jaribio", "Chaguo 1"),
+        ],
+    )
+    def test_api_returns_translation_with_lang_parameter(
+        self,
+        authenticated_client,
+        assert_no_nplusone,
+        translated_poll,
+        lang,
+        expected_title,
+        expected_option,
+    ):
+        """Test that API returns the requested language when lang is provided."""
+        poll = translated_poll
 
         url = reverse("poll-detail", kwargs={"pk": poll.id})
-        response = authenticated_client.get(url, {"lang": "sw"})
+        with assert_no_nplusone():
+            response = authenticated_client.get(url, {"lang": lang})
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data["title"] == "Uchaguzi wa Jaribio"
-        assert response.data["options"][0]["text"] == "Chaguo 1"
+        assert response.data["title"] == expected_title
+        assert response.data["options"][0]["text"] == expected_option
 
     def test_api_falls_back_to_english_when_translation_missing(
-        self, authenticated_client, user
+        self, authenticated_client, assert_no_nplusone, make_poll
     ):
         """Test that API falls back to English when requested translation is missing."""
         # Create poll with only English
-        poll = Poll.objects.create(
+        poll = make_poll(
             title="Test Poll",
-            created_by=user,
+            options=[{"text": "Option 1"}],
         )
-        PollOption.objects.create(poll=poll, text="Option 1")
 
         url = reverse("poll-detail", kwargs={"pk": poll.id})
-        response = authenticated_client.get(url, {"lang": "es"})
+        with assert_no_nplusone():
+            response = authenticated_client.get(url, {"lang": "es"})
 
         assert response.status_code == status.HTTP_200_OK
         # Should fallback to English
@@ -231,17 +224,17 @@ class TestAPILanguageParameter:
         assert response.data["options"][0]["text"] == "Option 1"
 
     def test_api_falls_back_to_english_for_invalid_language(
-        self, authenticated_client, user
+        self, authenticated_client, assert_no_nplusone, make_poll
     ):
         """Test that API falls back to English for invalid language code."""
-        poll = Poll.objects.create(
+        poll = make_poll(
             title="Test Poll",
-            created_by=user,
+            options=[{"text": "Option 1"}],
         )
-        PollOption.objects.create(poll=poll, text="Option 1")
 
         url = reverse("poll-detail", kwargs={"pk": poll.id})
-        response = authenticated_client.get(url, {"lang": "invalid"})
+        with assert_no_nplusone():
+            response = authenticated_client.get(url, {"lang": "invalid"})
 
         assert response.status_code == status.HTTP_200_OK
         # Should fallback to English
@@ -252,24 +245,31 @@ class TestAPILanguageParameter:
 class TestLanguageSwitching:
     """Test language switching functionality."""
 
-    def test_switch_language_in_list_endpoint(self, authenticated_client, user):
+    def test_switch_language_in_list_endpoint(
+        self, authenticated_client, assert_no_nplusone, user
+    ):
         """Test switching language in list endpoint."""
         # Create polls with translations
-        poll1 = Poll.objects.create(
-            title="Poll 1",
-            title_es="Encuesta 1",
-            created_by=user,
+        poll1, poll2 = Poll.objects.bulk_create(
+            [
+                Poll(title=f"Poll {i}", title_es=f"Encuesta {i}", created_by=user)
+                for i in (1, 2)
+            ]
         )
-        poll2 = Poll.objects.create(
-            title="Poll 2",
-            title_es="Encuesta 2",
-            created_by=user,
+        # Give each poll options, so a per-poll or per-option lookup would
+        # show up in the query count
+        PollOption.objects.bulk_create(
+            PollOption(poll=poll, text=f"Option {i}", text_es=f"Opción {i}", order=i)
+            for poll in (poll1, poll2)
+            for i in (1, 2)
         )
 
         url = reverse("poll-list")
-        response = authenticated_client.get(url, {"lang": "es"})
+        with assert_no_nplusone(), CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.get(url, {"lang": "es"})
 
         assert response.status_code == status.HTTP_200_OK
+        assert len(ctx.captured_queries) <= LIST_QUERY_BUDGET
         results = (
             response.data["results"] if "results" in response.data else response.data
         )
@@ -279,42 +279,34 @@ class TestLanguageSwitching:
         assert "Encuesta 1" in poll_titles
         assert "Encuesta 2" in poll_titles
 
-    def test_switch_language_in_detail_endpoint(self, authenticated_client, user):
+    def test_switch_language_in_detail_endpoint(
+        self, authenticated_client, assert_no_nplusone, translated_poll
+    ):
         """Test switching language in detail endpoint."""
-        poll = Poll.objects.create(
-            title="Test Poll",
-            title_es="Encuesta de Prueba",
-            title_fr="Sondage de Test",
-            description="English description",
-            description_es="Descripción en español",
-            description_fr="Description en français",
-            created_by=user,
-        )
-        PollOption.objects.create(
-            poll=poll,
-            text="Option 1",
-            text_es="Opción 1",
-            text_fr="Option 1 (FR)",
-        )
+        poll = translated_poll
 
         url = reverse("poll-detail", kwargs={"pk": poll.id})
 
         # Test English
-        response = authenticated_client.get(url, {"lang": "en"})
+        with assert_no_nplusone(), CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.get(url, {"lang": "en"})
         assert response.status_code == status.HTTP_200_OK
+        assert len(ctx.captured_queries) <= DETAIL_QUERY_BUDGET
         assert response.data["title"] == "Test Poll"
         assert response.data["description"] == "English description"
         assert response.data["options"][0]["text"] == "Option 1"
 
         # Test Spanish
-        response = authenticated_client.get(url, {"lang": "es"})
+        with assert_no_nplusone():
+            response = authenticated_client.get(url, {"lang": "es"})
         assert response.status_code == status.HTTP_200_OK
         assert response.data["title"] == "Encuesta de Prueba"
         assert response.data["description"] == "Descripción en español"
         assert response.data["options"][0]["text"] == "Opción 1"
 
         # Test French
-        response = authenticated_client.get(url, {"lang": "fr"})
+        with assert_no_nplusone():
+            response = authenticated_client.get(url, {"lang": "fr"})
         assert response.status_code == status.HTTP_200_OK
         assert response.data["title"] == "Sondage de Test"
         assert response.data["description"] == "Description en français"
@@ -326,21 +318,16 @@ class TestPartialTranslations:
     """Test handling of partial translations."""
 
     def test_partial_translation_falls_back_to_english(
-        self, authenticated_client, user
+        self, authenticated_client, make_poll
     ):
         """Test that partial translations fall back to English for missing fields."""
         # Create poll with only Spanish title, but English description
-        poll = Poll.objects.create(
+        poll = make_poll(
             title="Test Poll",
             title_es="Encuesta de Prueba",
             description="English description only",
-            created_by=user,
-        )
-        # Option with only Spanish text
-        PollOption.objects.create(
-            poll=poll,
-            text="Option 1",
-            text_es="Opción 1",
+            # Option with only Spanish text
+            options=[{"text": "Option 1", "text_es": "Opción 1"}],
         )
 
         url = reverse("poll-detail", kwargs={"pk": poll.id})
@@ -354,23 +341,16 @@ class TestPartialTranslations:
         # Option text should be Spanish
         assert response.data["options"][0]["text"] == "Opción 1"
 
-    def test_mixed_translations_in_options(self, authenticated_client, user):
+    def test_mixed_translations_in_options(self, authenticated_client, make_poll):
         """Test handling of mixed translations in options."""
-        poll = Poll.objects.create(
+        poll = make_poll(
             title="Test Poll",
-            created_by=user,
-        )
-        # Option 1: Full translations
-        PollOption.objects.create(
-            poll=poll,
-            text="Option 1",
-            text_es="Opción 1",
-            text_fr="Option 1 (FR)",
-        )
-        # Option 2: Only English
-        PollOption.objects.create(
-            poll=poll,
-            text="Option 2",
+            options=[
+                # Option 1: Full translations
+                {"text": "Option 1", "text_es": "Opción 1", "text_fr": "Option 1 (FR)"},
+                # Option 2: Only English
+                {"text": "Option 2"},
+            ],
         )
 
         url = reverse("poll-detail", kwargs={"pk": poll.id})
@@ -12,6 +12,7 @@ from core.services.export_service import (
     export_audit_trail,
     export_poll_results_pdf,
     export_vote_log,
+    stream_vote_log_csv,
 )
 from core.services.poll_analytics import (
     get_comprehensive_analytics,
@@ -47,6 +48,27 @@ from .templates import get_template, list_templates
 logger = logging.getLogger(__name__)
 
 
+def with_poll_serializer_relations(queryset):
+    """Eager-load everything PollSerializer nests for a poll queryset.
+
+    The category and tags carry a ``poll_count`` annotation, and the options a
+    ``num_votes`` one, so the nested serializers need no per-row COUNT query.
+    """
+    return queryset.select_related("created_by").prefetch_related(
+        models.Prefetch(
+            "category",
+            queryset=Category.objects.annotate(poll_count=models.Count("polls")),
+        ),
+        models.Prefetch(
+            "tags", queryset=Tag.objects.annotate(poll_count=models.Count("polls"))
+        ),
+        models.Prefetch(
+            "options",
+            queryset=PollOption.objects.annotate(num_votes=models.Count("votes")),
+        ),
+    )
+
+
 class PollViewSet(RateLimitHeadersMixin, viewsets.ModelViewSet):
     """
     ViewSet for Poll model with comprehensive CRUD operations.
@@ -88,6 +110,11 @@ class PollViewSet(RateLimitHeadersMixin, viewsets.ModelViewSet):
     def get_queryset(self):
         """Filter queryset based on query parameters."""
         queryset = Poll.objects.all()
+        if self.action in ["list", "retrieve"]:
+            queryset = with_poll_serializer_relations(queryset)
+        elif self.action == "clone":
+            # The owner check in IsPollOwnerOrReadOnly reads poll.created_by
+            queryset = queryset.select_related("created_by")
 
         # Filter out drafts from public listings (unless user is owner or explicitly requesting drafts)
         user = self.request.user
@@ -901,23 +928,30 @@ class PollViewSet(RateLimitHeadersMixin, viewsets.ModelViewSet):
 
         # Immediate export
         try:
+            if export_format == "csv":
+                from django.http import StreamingHttpResponse
+
+                # Stream rows as they are read instead of building the whole file
+                response = StreamingHttpResponse(
+                    stream_vote_log_csv(
+                        poll_id=poll.id,
+                        anonymize=anonymize,
+                        include_invalid=include_invalid,
+                    ),
+                    content_type="text/csv",
+                )
+                response[
+                    "Content-Disposition"
+                ] = f'attachment; filename="poll_{poll.id}_vote_log.csv"'
+                return response
+
             content = export_vote_log(
                 poll_id=poll.id,
                 format=export_format,
                 anonymize=anonymize,
                 include_invalid=include_invalid,
             )
-
-            if export_format == "csv":
-                from django.http import HttpResponse
-
-                response = HttpResponse(content, content_type="text/csv")
-                response[
-                    "Content-Disposition"
-                ] = f'attachment; filename="poll_{poll.id}_vote_log.csv"'
-                return response
-            else:
-                return Response(json.loads(content), status=status.HTTP_200_OK)
+            return Response(json.loads(content), status=status.HTTP_200_OK)
 
         except ValueError as e:
             return Response(
@@ -1513,7 +1547,7 @@ class PollViewSet(RateLimitHeadersMixin, viewsets.ModelViewSet):
 class CategoryViewSet(viewsets.ModelViewSet):
     """ViewSet for Category model."""
 
-    queryset = Category.objects.all()
+    queryset = Category.objects.annotate(poll_count=models.Count("polls"))
     serializer_class = CategorySerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
@@ -1526,7 +1560,7 @@ class CategoryViewSet(viewsets.ModelViewSet):
         """Get all polls in this category."""
         category = self.get_object()
         user = request.user
-        polls = category.polls.all()
+        polls = with_poll_serializer_relations(category.polls.all())
 
         # Filter out drafts from public listings
         if not user.is_authenticated:
@@ -1543,7 +1577,7 @@ class CategoryViewSet(viewsets.ModelViewSet):
 class TagViewSet(viewsets.ModelViewSet):
     """ViewSet for Tag model."""
 
-    queryset = Tag.objects.all()
+    queryset = Tag.objects.annotate(poll_count=models.Count("polls"))
     serializer_class = TagSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
@@ -1556,7 +1590,7 @@ class TagViewSet(viewsets.ModelViewSet):
         """Get all polls with this tag."""
         tag = self.get_object()
         user = request.user
-        polls = tag.polls.all()
+        polls = with_poll_serializer_relations(tag.polls.all())
 
         # Filter out drafts from public listings
         if not user.is_authenticated:
@@ -6,9 +6,10 @@ from pathlib import Path
 
 from .base import *  # noqa: F403, F401
 
-# Use file-based database for tests in a reliable location
-# pytest-django will automatically create tables and run migrations
-# Use a database file in the project directory for CI/CD compatibility
+# NAME is a database file in the project directory, used when commands such as
+# `manage.py migrate` run directly against these settings (CI/CD compatibility).
+# The test runner uses an in-memory database (TEST NAME below), so test writes
+# never touch the disk; pytest-django builds the tables from the models.
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 TEST_DB = BASE_DIR / "test_db.sqlite3"
 # Ensure parent directory exists
@@ -22,6 +23,9 @@ DATABASES = {
             "timeout": 30,  # Increased timeout for async operations
             "check_same_thread": False,  # Allow multiple threads (needed for async)
         },
+        "TEST": {
+            "NAME": ":memory:",
+        },
     }
 }
 
@@ -82,5 +86,9 @@ CHANNEL_LAYERS = {
     }
 }
 
+# Load nplusone's ORM hooks so tests can wrap requests in
+# nplusone.core.profiler.Profiler() and fail on lazy loads (N+1 queries)
+INSTALLED_APPS = INSTALLED_APPS + ["nplusone.ext.django"]  # noqa: F405
+
 # Static directory will be created by the workflow
 # This is handled in .github/workflows/test.yml
@@ -10,23 +10,28 @@ from django.contrib.auth.models import User
 pytest_plugins = ["pytest_django"]
 
 
-@pytest.fixture(scope="session")
-def django_db_setup(django_db_setup, django_db_blocker):
-    """Override django_db_setup to ensure all migrations are applied."""
-    # Let pytest-django do its initial setup first
-    # This creates the test database and runs migrations
+@pytest.fixture(scope="session", autouse=True)
+def preload_url_resolver():
+    """Build the URL resolver once so the first reverse() in a worker is cheap."""
+    from django.urls import get_resolver
+
+    get_resolver().url_patterns
 
-    # Then ensure all migrations are applied (in case some were missed)
-    with django_db_blocker.unblock():
-        from django.apps import apps
-        from django.core.management import call_command
 
-        # Ensure all apps are loaded
-        apps.check_apps_ready()
+@pytest.fixture(scope="module")
+def module_user(request, django_db_setup, django_db_blocker):
+    """Create one user shared by every test in the requesting module.
 
-        # Run migrations explicitly to ensure all apps' migrations are applied
-        # This will apply any migrations that weren't applied during initial setup
-        call_command("migrate", verbosity=1, interactive=False)
+    Modules whose tests only read their user alias this as ``user``. Rows a
+    test writes are still rolled back by ``django_db``; the user is deleted at
+    module teardown, which cascades to the polls module fixtures made for it.
+    """
+    username = request.module.__name__.rpartition(".")[2]
+    with django_db_blocker.unblock():
+        user = User.objects.create_user(username=username, password=None)
+    yield user
+    with django_db_blocker.unblock():
+        user.delete()
 
 
 # Factory-based fixtures
@@ -38,6 +43,34 @@ def user(db):
     return UserFactory()
 
 
+@pytest.fixture
+def make_poll(db, user):
+    """Return a helper that creates a poll owned by ``user`` with its options.
+
+    ``options`` is a list of PollOption field dicts, translations included; if
+    it is omitted, ``n_opts`` options named ``Option 1`` .. ``Option n`` are
+    made with ``order`` starting at 0. Options are inserted with one
+    ``bulk_create`` and ``tags`` with one insert into the through table. Extra
+    keyword arguments are passed to the poll.
+    """
+    from apps.polls.models import Poll, PollOption
+
+    def _make_poll(title="Original", n_opts=2, options=None, tags=(), **kwargs):
+        poll = Poll.objects.create(title=title, created_by=user, **kwargs)
+        if options is None:
+            options = [{"text": f"Option {i + 1}", "order": i} for i in range(n_opts)]
+        PollOption.objects.bulk_create(
+            PollOption(poll=poll, **option) for option in options
+        )
+        through = Poll.tags.through
+        through.objects.bulk_create(
+            through(poll_id=poll.pk, tag_id=tag.pk) for tag in tags
+        )
+        return poll
+
+    return _make_poll
+
+
 @pytest.fixture
 def poll(db, user):
     """Create a test poll using factory."""
@@ -90,6 +123,19 @@ def api_client():
     return APIClient()
 
 
+@pytest.fixture
+def assert_no_nplusone():
+    """Return a context manager that raises NPlusOneError on N+1 lazy loads.
+
+    Relies on the ``nplusone.ext.django`` app the test settings install. It
+    catches lazy-loaded relations only; pair it with a query budget to catch
+    per-row aggregate queries such as COUNT.
+    """
+    from nplusone.core.profiler import Profiler
+
+    return Profiler
+
+
 @pytest.fixture
 def authenticated_client(api_client, user):
     """Create an authenticated API client."""
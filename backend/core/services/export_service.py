@@ -9,7 +9,7 @@ import json
 import logging
 from datetime import datetime
 from io import BytesIO, StringIO
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 
 from apps.analytics.models import AuditLog
 from apps.polls.models import Poll
@@ -20,6 +20,16 @@ from django.utils import timezone
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round-trip when streaming a vote log
+VOTE_LOG_CHUNK_SIZE = 200
+
+
+class Echo:
+    """Pseudo-buffer whose write() returns the value, so csv.writer yields lines."""
+
+    def write(self, value):
+        return value
+
 
 def anonymize_ip(ip_address: Optional[str]) -> str:
     """
@@ -222,6 +232,105 @@ def export_poll_results_pdf(poll_id: int) -> BytesIO:
     return buffer
 
 
+def _get_poll(poll_id: int) -> Poll:
+    """Return the poll, raising ValueError if it does not exist."""
+    try:
+        return Poll.objects.get(id=poll_id)
+    except Poll.DoesNotExist:
+        raise ValueError(f"Poll {poll_id} not found")
+
+
+def _vote_log_queryset(poll_id: int, include_invalid: bool):
+    """Return the votes a vote log export covers, newest first."""
+    votes_query = Vote.objects.filter(poll_id=poll_id).select_related("user", "option")
+    if not include_invalid:
+        votes_query = votes_query.filter(is_valid=True)
+    return votes_query.order_by("-created_at")
+
+
+def stream_vote_log_csv(
+    poll_id: int,
+    anonymize: bool = False,
+    include_invalid: bool = False,
+) -> Iterator[str]:
+    """
+    Stream a poll's vote log as CSV, one line at a time.
+
+    The poll is looked up immediately; votes are read lazily in chunks of
+    VOTE_LOG_CHUNK_SIZE, so memory use does not grow with the vote count.
+
+    Args:
+        poll_id: Poll ID
+        anonymize: Whether to anonymize user data
+        include_invalid: Whether to include invalid votes
+
+    Returns:
+        Iterator[str]: CSV lines
+
+    Raises:
+        ValueError: If the poll does not exist
+    """
+    poll = _get_poll(poll_id)
+    votes = _vote_log_queryset(poll_id, include_invalid)
+    return _iter_vote_log_csv(poll, votes, anonymize)
+
+
+def _iter_vote_log_csv(poll: Poll, votes, anonymize: bool) -> Iterator[str]:
+    """Yield the vote log CSV for ``poll`` line by line."""
+    writer = csv.writer(Echo())
+
+    # Header
+    yield writer.writerow(["Vote Log Export"])
+    yield writer.writerow([f"Poll ID: {poll.id}"])
+    yield writer.writerow([f"Poll Title: {poll.title}"])
+    yield writer.writerow([f"Exported At: {timezone.now().isoformat()}"])
+    yield writer.writerow([f"Anonymized: {anonymize}"])
+    yield writer.writerow([])
+
+    # Column headers
+    headers = [
+        "Vote ID",
+        "Timestamp",
+        "Option",
+        "User",
+        "IP Address",
+        "User Agent",
+        "Valid",
+    ]
+    if not anonymize:
+        headers.extend(["Fingerprint", "Voter Token"])
+    yield writer.writerow(headers)
+
+    # Vote data
+    for vote in votes.iterator(chunk_size=VOTE_LOG_CHUNK_SIZE):
+        user_info = (
+            vote.user.username
+            if vote.user and not anonymize
+            else (anonymize_user_id(vote.user.id) if vote.user else "Anonymous")
+        )
+        ip_info = vote.ip_address if not anonymize else anonymize_ip(vote.ip_address)
+
+        row = [
+            vote.id,
+            vote.created_at.isoformat(),
+            vote.option.text,
+            user_info,
+            ip_info,
+            vote.user_agent[:50] if vote.user_agent else "N/A",  # Truncate long UAs
+            "Yes" if vote.is_valid else "No",
+        ]
+
+        if not anonymize:
+            row.extend(
+                [
+                    vote.fingerprint[:16] + "..." if vote.fingerprint else "N/A",
+                    vote.voter_token[:16] + "..." if vote.voter_token else "N/A",
+                ]
+            )
+
+        yield writer.writerow(row)
+
+
 def export_vote_log(
     poll_id: int,
     format: str = "csv",
@@ -240,78 +349,13 @@ def export_vote_log(
     Returns:
         str: Export content (CSV string or JSON string)
     """
-    try:
-        poll = Poll.objects.get(id=poll_id)
-    except Poll.DoesNotExist:
-        raise ValueError(f"Poll {poll_id} not found")
-
-    # Get votes
-    votes_query = Vote.objects.filter(poll_id=poll_id).select_related("user", "option")
-    if not include_invalid:
-        votes_query = votes_query.filter(is_valid=True)
-
-    votes = votes_query.order_by("-created_at")
-
     if format == "csv":
-        output = StringIO()
-        writer = csv.writer(output)
+        return "".join(stream_vote_log_csv(poll_id, anonymize, include_invalid))
 
-        # Header
-        writer.writerow(["Vote Log Export"])
-        writer.writerow([f"Poll ID: {poll.id}"])
-        writer.writerow([f"Poll Title: {poll.title}"])
-        writer.writerow([f"Exported At: {timezone.now().isoformat()}"])
-        writer.writerow([f"Anonymized: {anonymize}"])
-        writer.writerow([])
-
-        # Column headers
-        headers = [
-            "Vote ID",
-            "Timestamp",
-            "Option",
-            "User",
-            "IP Address",
-            "User Agent",
-            "Valid",
-        ]
-        if not anonymize:
-            headers.extend(["Fingerprint", "Voter Token"])
-        writer.writerow(headers)
-
-        # Vote data
-        for vote in votes:
-            user_info = (
-                vote.user.username
-                if vote.user and not anonymize
-                else (anonymize_user_id(vote.user.id) if vote.user else "Anonymous")
-            )
-            ip_info = (
-                vote.ip_address if not anonymize else anonymize_ip(vote.ip_address)
-            )
+    poll = _get_poll(poll_id)
+    votes = _vote_log_queryset(poll_id, include_invalid)
 
-            row = [
-                vote.id,
-                vote.created_at.isoformat(),
-                vote.option.text,
-                user_info,
-                ip_info,
-                vote.user_agent[:50] if vote.user_agent else "N/A",  # Truncate long UAs
-                "Yes" if vote.is_valid else "No",
-            ]
-
-            if not anonymize:
-                row.extend(
-                    [
-                        vote.fingerprint[:16] + "..." if vote.fingerprint else "N/A",
-                        vote.voter_token[:16] + "..." if vote.voter_token else "N/A",
-                    ]
-                )
-
-            writer.writerow(row)
-
-        return output.getvalue()
-
-    elif format == "json":
+    if format == "json":
         votes_data = []
         for vote in votes:
             vote_dict = {